@@ -6,6 +6,7 @@ from .app import main
 from . import assets
 from . import config
 from . import data
+from . import fast_ini
 from . import imports
 
 __all__ = [
@@ -13,6 +14,7 @@ __all__ = [
     "assets",
     "config",
     "data",
+    "fast_ini",
     "imports",
     "ClockApp",
     "main",
@@ -5,30 +5,105 @@ This is a clock app.
 It will display the current time and date.
 """
 
-import configparser
+from __future__ import annotations
+
 import os
 import threading
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Callable
+
+from . import fast_ini
+from .imports import Loading
+from .assets.lib.lang import translator
+from .assets.lib.lang.translator import format_text, set_language, t
+
+if TYPE_CHECKING:
+    from .data.update_checker import UpdateResult
+    from .imports import Clock, Console, MainMenu, Options
+
+_RESIZE_KEYS: tuple[str, ...] = (
+    "<KeyPress-equal>", "<KeyPress-plus>", "<KeyPress-minus>", "<KeyPress-underscore>",
+)
+
+# Theme name (lowercase) -> (background, foreground)
+_PALETTE: dict[str, tuple[str, str]] = {
+    "dark": ("#2b2b2b", "#e0e0e0"),
+    "light": ("#f0f0f0", "#000000"),
+}
+# Comment/secondary text color keyed by "is dark theme"
+_COMMENT_FG: dict[bool, str] = {True: "#888888", False: "gray"}
 
-from .imports import Clock, Console, Loading, MainMenu, Options
-from .assets.lib.lang.translator import set_language, t
-from .data.update_checker import UpdateResult, check_for_updates
+# D.app_update_check_frequency -> auto-update interval
+_UPDATE_INTERVAL_MS: dict[str, int] = {
+    "Daily": 86400_000, "Weekly": 604_800_000, "Monthly": 2_592_000_000,
+}
 
+# Parsed clock_app.ini keyed by path: (st_mtime_ns, {section: {key: value}})
+_INI_CACHE: dict[str, tuple[int, dict[str, dict[str, str]]]] = {}
 
-def _init_translations() -> None:
-    """Load language from config, or default to English."""
+
+def _get_ini() -> dict[str, dict[str, str]]:
+    """Return parsed clock_app.ini as {section: {key: value}}; reparse only when mtime changes."""
     from .imports import CLOCK_APP_INI_PATH
-    lang = "English"
-    if os.path.exists(CLOCK_APP_INI_PATH):
-        cfg = configparser.ConfigParser()
-        cfg.optionxform = str
-        cfg.read(CLOCK_APP_INI_PATH, encoding="utf-8")
-        for sect in ["-S- General"]:
-            if cfg.has_section(sect) and cfg.has_option(sect, "D.app_language"):
-                lang = cfg.get(sect, "D.app_language").strip() or lang
-                break
-    set_language(lang)
+    try:
+        mtime = os.stat(CLOCK_APP_INI_PATH).st_mtime_ns
+    except OSError:
+        _INI_CACHE.pop(CLOCK_APP_INI_PATH, None)
+        return {}
+    cached = _INI_CACHE.get(CLOCK_APP_INI_PATH)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = fast_ini.load(CLOCK_APP_INI_PATH)
+    _INI_CACHE[CLOCK_APP_INI_PATH] = (mtime, data)
+    return data
+
+
+@dataclass
+class StartupConfig:
+    """Settings the app reads from clock_app.ini outside the Options menu."""
+
+    language: str = "English"
+    theme: str = "Light"
+    notifications_enabled: bool = True
+    update_option: str = "Automatic"
+    update_source: str = "GitHub"
+    update_frequency: str = "Daily"
+
+
+def _ini_option(ini: dict[str, dict[str, str]], section: str, name: str) -> str | None:
+    """Return stripped value of widget_var.name in section, or None if absent."""
+    for key, val in ini.get(section, {}).items():
+        if key.split(".", 1)[-1] == name:
+            return val.strip()
+    return None
+
+
+def _bootstrap_config(ini: dict[str, dict[str, str]] | None = None) -> StartupConfig:
+    """Build StartupConfig from a single parse of clock_app.ini."""
+    if ini is None:
+        ini = _get_ini()
+    cfg = StartupConfig()
+    cfg.language = _ini_option(ini, "-S- General", "app_language") or cfg.language
+    cfg.theme = _ini_option(ini, "-S- Display", "app_theme") or cfg.theme
+    notif = _ini_option(ini, "-S- Notifications", "app_notification_option")
+    if notif is not None:
+        cfg.notifications_enabled = notif.lower() in ("true", "1", "yes", "on")
+    for field, name in (
+        ("update_option", "app_update_option"),
+        ("update_source", "app_update_source"),
+        ("update_frequency", "app_update_check_frequency"),
+    ):
+        val = _ini_option(ini, "-S- Updates", name)
+        if val is not None:
+            setattr(cfg, field, val)
+    return cfg
+
+
+def _init_translations(language: str) -> None:
+    """Load the configured language, or default to English."""
+    set_language(language or "English")
 
 
 class ClockApp(tk.Tk):
@@ -37,10 +112,18 @@ class ClockApp(tk.Tk):
     It will display the current time and date.
     """
 
+    # ttk style classes that take the theme's background/foreground pair
+    _THEMED_CLASSES: tuple[str, ...] = (
+        ".", "TFrame", "TLabel", "TButton", "TLabelframe",
+        "TLabelframe.Label", "TCheckbutton",
+    )
+
     def __init__(self):
         super().__init__()
-        _init_translations()
-        self.title(t("app.title"))
+        self._startup_ini: dict[str, dict[str, str]] | None = None
+        self._startup_config = StartupConfig()
+        _init_translations(self._current_config().language)
+        self.title(translator.S.APP_TITLE)
         self.geometry("400x300")
         self.resizable(True, True)
         self.grid_rowconfigure(0, weight=1)
@@ -49,89 +132,111 @@ class ClockApp(tk.Tk):
         self.date_format = "%d/%m/%Y"
         self.time_label_text = "00:00:00"
         self.date_label_text = "00/00/0000"
-        self.options: Options | None = None
-        self.main_menu: MainMenu | None = None
-        self.clock: Clock | None = None
+        # Menus are built on first access (see the properties below)
+        self._options: Options | None = None
+        self._main_menu: MainMenu | None = None
+        self._clock: Clock | None = None
         self.console: Console | None = None
+        self._console_path = ""
         self._console_visible = False
         self._console_expanded = False
+        self._resize_keys_bound = False
+        self._ini_exists = False
         self.current_menu: str = ""
         self._update_check_scheduled: str | None = None
+        self._update_cfg: dict[str, str] = {}
         self._theme_bg = "#f0f0f0"
         self._theme_fg = "#000000"
         self._theme_dark = False
+        self._theme_applied = False
+        self._style = ttk.Style(self)
+        self._trans_callbacks: list[Callable[[], None]] = []
+        self._theme_callbacks: list[Callable[[], None]] = []
         self.loading = Loading(self)
+        self._register_widget(self.loading)
         self.loading.grid(row=0, column=0, sticky="nsew")
         self.current_menu = "loading"
-        self.after(50, self._load_step_1)
-
-    def _load_step_1(self) -> None:
-        """Step 1: Create ini if needed."""
+        self._current_widget: tk.Misc | None = self.loading
+        # Menu name -> widget getter (main/options/clock are built on first access)
+        self._menus: dict[str, Callable[[], tk.Misc]] = {
+            "loading": lambda: self.loading,
+            "main": lambda: self.main_menu,
+            "options": lambda: self.options,
+            "clock": lambda: self.clock,
+        }
+        self.after_idle(self._bootstrap)
+
+    @property
+    def options(self) -> Options:
+        """Options menu, built on first access."""
+        if self._options is None:
+            from .imports import Options
+            self._options = Options(self)
+            self._register_widget(self._options)
+        return self._options
+
+    @property
+    def main_menu(self) -> MainMenu:
+        """Main Menu, built on first access."""
+        if self._main_menu is None:
+            from .imports import MainMenu
+            self._main_menu = MainMenu(self)
+            self._register_widget(self._main_menu)
+        return self._main_menu
+
+    @property
+    def clock(self) -> Clock:
+        """Clock display, built on first access."""
+        if self._clock is None:
+            from .imports import Clock
+            self._clock = Clock(self)
+            self._register_widget(self._clock)
+        return self._clock
+
+    def _bootstrap(self) -> None:
+        """Create ini if needed, then show Main Menu (menus are built lazily)."""
         from .imports import create_clock_app_ini, CLOCK_APP_INI_PATH
 
-        if not os.path.exists(CLOCK_APP_INI_PATH):
+        if not os.path.isfile(CLOCK_APP_INI_PATH):
             create_clock_app_ini()
-        self.loading.set_progress(10)
-        self.after(50, self._load_step_2)
-
-    def _load_step_2(self) -> None:
-        """Step 2: Load Options."""
-        self.options = Options(self)
-        self.loading.set_progress(40)
-        self.after(50, self._load_step_3)
-
-    def _load_step_3(self) -> None:
-        """Step 3: Load MainMenu and Clock."""
-        self.main_menu = MainMenu(self)
-        self.clock = Clock(self)
-        self.loading.set_progress(70)
-        self.after(50, self._load_step_4)
-
-    def _load_step_4(self) -> None:
-        """Step 4: Complete and switch to Main Menu."""
+        # The ini is not removed during a session; later checks use this flag
+        self._ini_exists = True
         self.loading.set_progress(100)
-        self.after(150, self._switch_to_main)
+        self._switch_to_main()
 
     def _switch_to_main(self) -> None:
         """Hide loading screen and show Main Menu."""
-        self.loading.grid_forget()
         self._apply_theme_from_config()
         self.switch_menu("main")
         self._setup_console()
-        self._schedule_auto_update()
+        self.refresh_update_config()
+
+    def _current_config(self) -> StartupConfig:
+        """Return StartupConfig, rebuilt only when clock_app.ini changed on disk."""
+        ini = _get_ini()
+        if ini is not self._startup_ini:
+            self._startup_ini = ini
+            self._startup_config = _bootstrap_config(ini)
+        return self._startup_config
 
     def _apply_theme_from_config(self) -> None:
         """Read theme from clock_app.ini and apply it."""
-        from .imports import CLOCK_APP_INI_PATH
-        theme = "Light"
-        if os.path.exists(CLOCK_APP_INI_PATH):
-            cfg = configparser.ConfigParser()
-            cfg.optionxform = str
-            cfg.read(CLOCK_APP_INI_PATH, encoding="utf-8")
-            if cfg.has_section("-S- Display") and cfg.has_option("-S- Display", "D.app_theme"):
-                theme = cfg.get("-S- Display", "D.app_theme").strip() or theme
-        self.apply_theme(theme)
+        self.apply_theme(self._current_config().theme)
 
     def apply_theme(self, theme_name: str) -> None:
         """Only invert colors: set bg/fg on root and ttk. Layout and theme are unchanged."""
-        name = (theme_name or "Light").strip()
-        is_dark = name.lower() == "dark"
-        style = ttk.Style()
-        # Do not call theme_use() - keep current theme so layout (padding, sizes) is unchanged
-        if is_dark:
-            bg, fg = "#2b2b2b", "#e0e0e0"
-        else:
-            bg, fg = "#f0f0f0", "#000000"
+        key = (theme_name or "Light").strip().lower()
+        bg, fg = _PALETTE.get(key, _PALETTE["light"])
+        if self._theme_applied and (bg, fg) == (self._theme_bg, self._theme_fg):
+            return
+        self._theme_applied = True
         self._theme_bg, self._theme_fg = bg, fg
-        self._theme_dark = is_dark
+        self._theme_dark = key == "dark"
         self.configure(bg=bg)
-        style.configure(".", background=bg, foreground=fg)
-        style.configure("TFrame", background=bg)
-        style.configure("TLabel", background=bg, foreground=fg)
-        style.configure("TButton", background=bg, foreground=fg)
-        style.configure("TLabelframe", background=bg, foreground=fg)
-        style.configure("TLabelframe.Label", background=bg, foreground=fg)
-        style.configure("TCheckbutton", background=bg, foreground=fg)
+        # Do not call theme_use() - keep current theme so layout (padding, sizes) is unchanged
+        style = self._style
+        for cls in self._THEMED_CLASSES:
+            style.configure(cls, background=bg, foreground=fg)
         style.configure("TCombobox", fieldbackground=bg,
                         foreground=fg, background=bg)
         self._refresh_theme_colors()
@@ -145,62 +250,80 @@ class ClockApp(tk.Tk):
 
     def get_theme_comment_fg(self) -> str:
         """Return foreground color for comment/secondary text (theme-aware)."""
-        return "#888888" if getattr(self, "_theme_dark", False) else "gray"
+        return _COMMENT_FG[self._theme_dark]
+
+    def _register_widget(self, widget: tk.Misc) -> None:
+        """Record a menu's refresh_translations/refresh_theme_colors callbacks once."""
+        for name, callbacks in (
+            ("refresh_translations", self._trans_callbacks),
+            ("refresh_theme_colors", self._theme_callbacks),
+        ):
+            cb = getattr(widget, name, None)
+            if callable(cb):
+                callbacks.append(cb)
 
     def _refresh_theme_colors(self) -> None:
         """Notify all menus to apply current theme colors (bg/fg only)."""
-        for widget in (self.loading, self.main_menu, self.options, self.clock, self.console):
-            if widget is not None and hasattr(widget, "refresh_theme_colors"):
-                widget.refresh_theme_colors()
+        for cb in self._theme_callbacks:
+            cb()
 
     def _setup_console(self) -> None:
         """Create console and bind ~ / ` to toggle."""
+        from .imports import Console
         self.console = Console(self)
+        self._register_widget(self.console)
+        self._console_path = str(self.console)
         for key in ("<KeyPress-asciitilde>", "<KeyPress-quoteleft>"):
             self.bind_all(key, self._on_console_key)
-        self.bind_all("<Button-1>", self._on_console_click_out)
-        for key in ("<KeyPress-equal>", "<KeyPress-plus>", "<KeyPress-minus>",
-                    "<KeyPress-underscore>"):
-            self.bind_all(key, self._on_resize_key)
+        # <Button-1> is bound only while the console is visible (see toggle_console)
+        # and the resize keys only while resize mode is on (see set_resize_keys_enabled).
+
+    def set_resize_keys_enabled(self, enabled: bool) -> None:
+        """Bind =/+ and -/_ app-wide while a clock element is in resize mode."""
+        if enabled == self._resize_keys_bound:
+            return
+        self._resize_keys_bound = enabled
+        for key in _RESIZE_KEYS:
+            if enabled:
+                self.bind_all(key, self._on_resize_key)
+            else:
+                self.unbind_all(key)
 
     def _is_console_or_descendant(self, widget: tk.Widget) -> bool:
-        """Return True if widget is the console or a child of it."""
-        w = widget
-        while w:
-            if w == self.console:
-                return True
-            try:
-                parent = w.nametowidget(w.winfo_parent())
-            except (KeyError, tk.TclError):
-                break
-            if parent == w:
-                break
-            w = parent
-        return False
-
-    def _on_console_click_out(self, event: tk.Event) -> None:
-        """When console is visible, clicking outside it moves focus away from entry."""
+        """Return True if widget is the console or a child of it (Tk path-name prefix)."""
+        if not self._console_path:
+            return False
+        wpath = str(widget)
+        return wpath == self._console_path or wpath.startswith(self._console_path + ".")
+
+    def _on_console_click_out(self, event: tk.Event) -> str | None:
+        """When console is visible, clicking outside it moves focus away from entry.
+        Terminal handler: returns "break" once focus has been moved."""
         if not self._console_visible or not self.console:
-            return
+            return None
         if not self._is_console_or_descendant(event.widget):
             self.focus_set()
+            return "break"
+        return None
 
-    def _on_console_key(self, event: tk.Event) -> None:
-        """Toggle console on ~ or ` (only when focus is not in console entry)."""
+    def _on_console_key(self, event: tk.Event) -> str | None:
+        """Toggle console on ~ or ` (only when focus is not in console entry).
+        Terminal handler: returns "break" so the key is not also delivered elsewhere."""
         if self.console and self._is_console_or_descendant(event.widget):
-            return
+            return None
         self.toggle_console()
+        return "break"
 
     def _on_resize_key(self, event: tk.Event) -> str | None:
         """Handle =/+ (increase) and -/_ (decrease) for resize mode."""
         if self.console and self._is_console_or_descendant(event.widget):
             return None
-        if not self.clock or self.clock._resize_mode_element is None:
+        if not self._clock or self._clock._resize_mode_element is None:
             return None
         keysym = event.keysym
-        if keysym in ("equal", "plus") and self.clock.adjust_resize_scale(0.1):
+        if keysym in ("equal", "plus") and self._clock.adjust_resize_scale(0.1):
             return "break"
-        if keysym in ("minus", "underscore") and self.clock.adjust_resize_scale(-0.1):
+        if keysym in ("minus", "underscore") and self._clock.adjust_resize_scale(-0.1):
             return "break"
         return None
 
@@ -215,14 +338,21 @@ class ClockApp(tk.Tk):
             self.grid_rowconfigure(1, weight=0)
             self.console.set_collapsed(True)
             self.console.entry.focus_set()
+            self.bind_all("<Button-1>", self._on_console_click_out)
         elif not self._console_expanded:
             self._console_expanded = True
             self.console.set_collapsed(False)
             self.grid_rowconfigure(1, weight=1)
         else:
-            self._console_visible = False
-            self._console_expanded = False
-            self.grid_rowconfigure(1, weight=0)
+            self.hide_console()
+
+    def hide_console(self) -> None:
+        """Close the console and drop the click-out binding."""
+        self._console_visible = False
+        self._console_expanded = False
+        self.grid_rowconfigure(1, weight=0)
+        self.unbind_all("<Button-1>")
+        if self.console is not None:
             self.console.grid_forget()
 
     def check_for_updates_async(
@@ -230,7 +360,9 @@ class ClockApp(tk.Tk):
     ) -> None:
         """Run update check in a background thread. Callback shows popup if update found."""
         def _run() -> None:
-            result = check_for_updates()
+            from .data.update_checker import check_for_updates
+            # Manual checks always ask GitHub (a 304 if unchanged); automatic ones may reuse the cache
+            result = check_for_updates(force=is_manual)
             self.after(0, lambda: self._on_update_check_result(
                 result, show_no_update=show_no_update, is_manual=is_manual
             ))
@@ -238,14 +370,14 @@ class ClockApp(tk.Tk):
 
     def _on_update_check_result(
         self,
-        result: UpdateResult,
+        result: "UpdateResult",
         show_no_update: bool = False,
         is_manual: bool = False,
     ) -> None:
         """Handle update check result on main thread. Show popup if appropriate."""
         if result.error:
             messagebox.showwarning(
-                t("update.error_title", "Update Check"),
+                translator.S.UPDATE_ERROR_TITLE,
                 t("update.error_message",
                   "Could not check for updates: {error}", error=result.error),
             )
@@ -257,30 +389,42 @@ class ClockApp(tk.Tk):
                 "update.available_message",
                 "A new version {latest} is available.\n\n{notes}\n\nOpen download page?",
             )
-            notes = (result.release_notes or "")[:500]
-            if len((result.release_notes or "")) > 500:
+            raw = result.release_notes or ""
+            notes = raw[:500]
+            if len(raw) > 500:
                 notes += "..."
-            if notes:
-                notes = notes.replace("\r\n", "\n").strip() + "\n\n"
-            else:
-                notes = ""
+            notes = notes.replace("\r\n", "\n").strip()
+            notes = notes + "\n\n" if notes else ""
             body = msg.format(latest=result.latest_version, notes=notes)
-            if messagebox.askyesno(t("update.available_title", "Update Available"), body):
+            if messagebox.askyesno(translator.S.UPDATE_AVAILABLE_TITLE, body):
                 import webbrowser
                 webbrowser.open(result.release_url)
         elif show_no_update:
             messagebox.showinfo(
-                t("update.up_to_date_title", "Up to Date"),
-                t("update.up_to_date_message",
-                  "You have the latest version ({version}).", version=result.current_version),
+                translator.S.UPDATE_UP_TO_DATE_TITLE,
+                format_text(translator.S.UPDATE_UP_TO_DATE_MESSAGE,
+                            version=result.current_version),
             )
 
+    def refresh_update_config(self) -> None:
+        """Re-read update settings from clock_app.ini and re-arm the auto-update timer."""
+        config = self._current_config()
+        self._update_cfg = {
+            "update_option": config.update_option,
+            "source": config.update_source,
+            "frequency": config.update_frequency,
+        }
+        if self._update_check_scheduled is not None:
+            self.after_cancel(self._update_check_scheduled)
+            self._update_check_scheduled = None
+        self._schedule_auto_update()
+
     def _schedule_auto_update(self) -> None:
         """Schedule automatic update check if configured."""
-        config = self._load_update_config()
-        if (config.get("update_option") or "").strip().lower() != "automatic":
+        config = self._update_cfg
+        if config["update_option"].lower() != "automatic":
             return
-        if (config.get("source") or "").strip().lower() != "github":
+        if config["source"].lower() != "github":
             return
         # First check after 30 seconds; then reschedule based on frequency
         self._update_check_scheduled = self.after(30_000, self._do_auto_update)
@@ -289,72 +433,38 @@ class ClockApp(tk.Tk):
         """Run automatic update check and reschedule."""
         self._update_check_scheduled = None
         self.check_for_updates_async(show_no_update=False)
-        config = self._load_update_config()
-        if (config.get("update_option") or "").strip().lower() != "automatic":
+        config = self._update_cfg
+        if config["update_option"].lower() != "automatic":
             return
-        ms = {"Daily": 86400_000, "Weekly": 604_800_000, "Monthly": 2_592_000_000}.get(
-            (config.get("frequency") or "Daily").strip(), 86400_000
-        )
+        ms = _UPDATE_INTERVAL_MS.get(config["frequency"] or "Daily", 86400_000)
         self._update_check_scheduled = self.after(ms, self._do_auto_update)
 
     def _notifications_enabled(self) -> bool:
         """Return True if app notifications are enabled in config."""
-        from .imports import CLOCK_APP_INI_PATH
-        if not os.path.exists(CLOCK_APP_INI_PATH):
-            return True
-        cfg = configparser.ConfigParser()
-        cfg.optionxform = str
-        cfg.read(CLOCK_APP_INI_PATH, encoding="utf-8")
-        for sect in ["-S- Notifications"]:
-            if not cfg.has_section(sect):
-                continue
-            for key in cfg.options(sect):
-                if "app_notification_option" in key:
-                    val = cfg.get(sect, key).strip().lower()
-                    return val in ("true", "1", "yes", "on")
-        return True
-
-    def _load_update_config(self) -> dict:
-        """Load update-related config from ini."""
-        from .data.update_checker import _load_update_config
-        return _load_update_config()
+        return self._current_config().notifications_enabled
 
     def refresh_translations(self) -> None:
         """Reload translated text across the app after language change."""
-        self.title(t("app.title"))
-        if self.loading and hasattr(self.loading, "refresh_translations"):
-            self.loading.refresh_translations()
-        if self.main_menu and hasattr(self.main_menu, "refresh_translations"):
-            self.main_menu.refresh_translations()
-        if self.options and hasattr(self.options, "refresh_translations"):
-            self.options.refresh_translations()
-        if self.clock and hasattr(self.clock, "refresh_translations"):
-            self.clock.refresh_translations()
+        self.title(translator.S.APP_TITLE)
+        for cb in self._trans_callbacks:
+            cb()
 
     def switch_menu(self, menu: str) -> None:
         """
         Switch to the specified menu.
         """
-        if self.loading is not None:
-            self.loading.grid_forget()
-        if self.main_menu is not None:
-            self.main_menu.grid_forget()
-        if self.options is not None:
-            self.options.grid_forget()
-        if self.clock is not None:
-            self.clock.grid_forget()
+        try:
+            get_widget = self._menus[menu]
+        except KeyError:
+            raise ValueError(f"Invalid menu: {menu}") from None
+        widget = get_widget()
         self.current_menu = menu
-        if menu == "main":
-            assert self.main_menu is not None
-            self.main_menu.grid(row=0, column=0, sticky="nsew")
-        elif menu == "options":
-            assert self.options is not None
-            self.options.grid(row=0, column=0, sticky="nsew")
-        elif menu == "clock":
-            assert self.clock is not None
-            self.clock.grid(row=0, column=0, sticky="nsew")
-        else:
-            raise ValueError(f"Invalid menu: {menu}")
+        if widget is self._current_widget:
+            return
+        if self._current_widget is not None:
+            self._current_widget.grid_forget()
+        widget.grid(row=0, column=0, sticky="nsew")
+        self._current_widget = widget
 
     def quit_app(self) -> None:
         """
@@ -1,12 +1,14 @@
 # Auto-generated __init__.py
 
 from . import translator
+from .translator import format_text
 from .translator import get_available_codes
 from .translator import set_language
 from .translator import t
 
 __all__ = [
     "translator",
+    "format_text",
     "get_available_codes",
     "set_language",
     "t",
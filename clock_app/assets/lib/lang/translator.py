@@ -8,8 +8,16 @@ from __future__ import annotations
 
 import json
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Map config language names to ISO 639-1 codes (file names)
 LANG_NAME_TO_CODE: dict[str, str] = {
     "English": "en",
@@ -25,33 +33,90 @@ LANG_NAME_TO_CODE: dict[str, str] = {
 
 # Default fallback when no translation exists
 _FALLBACK: dict[str, str] = {}
+# Bound _FALLBACK.get, rebound in set_language() to skip the attribute lookup in t()
+_GET = _FALLBACK.get
+
+
+@dataclass(frozen=True)
+class TranslatedStrings:
+    """Constant app strings resolved once per set_language() call."""
+
+    APP_TITLE: str
+    UPDATE_ERROR_TITLE: str
+    UPDATE_AVAILABLE_TITLE: str
+    UPDATE_UP_TO_DATE_TITLE: str
+    UPDATE_UP_TO_DATE_MESSAGE: str
+
+
+# TranslatedStrings field -> (translation key, default)
+_STRING_KEYS: dict[str, tuple[str, str]] = {
+    "APP_TITLE": ("app.title", "app.title"),
+    "UPDATE_ERROR_TITLE": ("update.error_title", "Update Check"),
+    "UPDATE_AVAILABLE_TITLE": ("update.available_title", "Update Available"),
+    "UPDATE_UP_TO_DATE_TITLE": ("update.up_to_date_title", "Up to Date"),
+    "UPDATE_UP_TO_DATE_MESSAGE": (
+        "update.up_to_date_message", "You have the latest version ({version})."
+    ),
+}
+
+
+def _build_strings() -> TranslatedStrings:
+    """Resolve every TranslatedStrings field against the current language."""
+    return TranslatedStrings(**{
+        name: _GET(key, default) for name, (key, default) in _STRING_KEYS.items()
+    })
+
 
+# Current language's constant strings; rebuilt by set_language()
+S: TranslatedStrings = _build_strings()
 
+# Parsed language files keyed by path: (st_mtime_ns, translations)
+_JSON_CACHE: dict[str, tuple[int, dict[str, str]]] = {}
+
+
+@lru_cache(maxsize=1)
 def _lang_dir() -> str:
     """Return the directory containing language JSON files."""
     return os.path.dirname(os.path.abspath(__file__))
 
 
+# lang/{code}.json for every configurable language, joined once at import
+_LANG_PATHS: dict[str, str] = {
+    code: os.path.join(_lang_dir(), f"{code}.json") for code in LANG_NAME_TO_CODE.values()
+}
+
+
 def _load_json(code: str) -> dict[str, str]:
     """Load translations from lang/{code}.json. Returns empty dict on error."""
-    path = os.path.join(_lang_dir(), f"{code}.json")
-    if not os.path.exists(path):
+    path = _LANG_PATHS.get(code) or os.path.join(_lang_dir(), f"{code}.json")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
         return {}
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-        return {str(k): str(v) for k, v in data.items() if isinstance(v, str)}
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+    except (ValueError, OSError):  # JSONDecodeError (json and orjson) subclasses ValueError
         return {}
+    # JSON object keys are always str; only filter when a non-string value slipped in
+    if not all(isinstance(v, str) for v in data.values()):
+        data = {k: v for k, v in data.items() if isinstance(v, str)}
+    _JSON_CACHE[path] = (mtime, data)
+    return data
 
 
 def set_language(lang_name: str) -> None:
     """Load translations for the given language (e.g. 'English', 'French')."""
-    global _FALLBACK
+    global _FALLBACK, _GET, S
     code = LANG_NAME_TO_CODE.get(lang_name, "en")
     _FALLBACK = _load_json(code)
     if not _FALLBACK and code != "en":
         _FALLBACK = _load_json("en")
+    _GET = _FALLBACK.get
+    S = _build_strings()
 
 
 def t(key: str, default: str | None = None, *args: Any, **kwargs: Any) -> str:
@@ -60,15 +125,18 @@ def t(key: str, default: str | None = None, *args: Any, **kwargs: Any) -> str:
     Call set_language() first to load a language.
     Pass format args: t("key", "default", "val") or t("key", foo="val").
     """
-    out = _FALLBACK.get(key)
-    if out is None:
-        out = default if default is not None else key
-    if args or kwargs:
-        try:
-            out = out.format(*args, **kwargs)
-        except (KeyError, ValueError):
-            pass
-    return out
+    out = _GET(key, key if default is None else default)
+    if not (args or kwargs):
+        return out
+    return format_text(out, *args, **kwargs)
+
+
+def format_text(text: str, *args: Any, **kwargs: Any) -> str:
+    """Format a translated string; return it unchanged if its placeholders don't match."""
+    try:
+        return text.format(*args, **kwargs)
+    except (KeyError, ValueError):
+        return text
 
 
 def get_available_codes() -> list[str]:
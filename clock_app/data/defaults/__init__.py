@@ -2,8 +2,14 @@
 
 from . import default_options
 from .default_options import DefaultOptions
+from .default_options import WIDGET_TYPES
+from .default_options import get_default_options
+from .default_options import reload_defaults
 
 __all__ = [
     "default_options",
     "DefaultOptions",
+    "WIDGET_TYPES",
+    "get_default_options",
+    "reload_defaults",
 ]
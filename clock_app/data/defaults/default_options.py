@@ -6,220 +6,284 @@ It will contain the default options for the clock app.
 
 from __future__ import annotations
 
-import configparser
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from typing import Any
 
-class DefaultOptions(configparser.ConfigParser):
-    """
-    This is the default options class for the clock app.
-    It will contain the default options for the clock app.
-    """
+# Read-only choice lists shared by every DefaultOptions instance
+_SUPPORTED_LANGUAGES: tuple[str, ...] = (
+    "English", "Arabic", "French", "German", "Italian", "Portuguese", "Russian",
+    "Spanish", "Turkish",
+)
+_SUPPORTED_THEMES: tuple[str, ...] = ("Light", "Dark")
+_SUPPORTED_TIMEZONES: tuple[str, ...] = (
+    "UTC", "GMT", "EST", "CST", "MST", "PST", "etc.",
+)
+_SUPPORTED_TIME_SEPARATORS: tuple[str, ...] = (":", "-", ".")
+_SUPPORTED_DATE_SEPARATORS: tuple[str, ...] = ("/", "-", ".", ":")
+_SUPPORTED_DATE_FORMATS: tuple[str, ...] = (
+    "'dd' {self.app_date_separator} 'mm' {self.app_date_separator} 'yyyy'",
+    "'mm' {self.app_date_separator} 'dd' {self.app_date_separator} 'yyyy'",
+    "'yyyy' {self.app_date_separator} 'mm' {self.app_date_separator} 'dd'",
+)
+_SUPPORTED_CLOCK_COLORS: tuple[str, ...] = (
+    "Red", "Green", "Blue", "Yellow", "Purple", "Orange", "Pink", "Brown", "Gray",
+    "Black", "White",
+)
+_SUPPORTED_CLOCK_FONTS: tuple[str, ...] = (
+    "Arial", "Times New Roman", "Courier New", "Verdana",
+)
+_SUPPORTED_NOTIFICATION_OPTIONS: tuple[str, ...] = ("On", "Off")
+_SUPPORTED_NOTIFICATION_TYPES: tuple[str, ...] = ("Vibrate", "Sound", "Popup")
+_SUPPORTED_UPDATE_OPTIONS: tuple[str, ...] = ("Automatic", "Manual")
+_SUPPORTED_UPDATE_CHANNELS: tuple[str, ...] = ("Stable", "Beta", "Dev")
+_SUPPORTED_UPDATE_CHECK_FREQUENCIES: tuple[str, ...] = ("Daily", "Weekly", "Monthly")
+_SUPPORTED_UPDATE_SOURCES: tuple[str, ...] = ("GitHub", "Stream", "Local")
+_OPTION_CATEGORIES: tuple[str, ...] = ("App Info", "App Settings")
+_OPTION_SECTIONS: tuple[str, ...] = (
+    "General", "Display", "Behavior", "Notifications", "Updates"
+)
 
-    def __init__(self):
-        super().__init__()
-        self.config = configparser.ConfigParser()
-        # Widget type names; options are added per widget in option_format below.
-        self.widget_variables_list: dict[str, dict[str, Any]] = {
-            "-C-": {"widget_type": "Category"},
-            "-S-": {"widget_type": "Section"},
-            "L": {"widget_type": "Label"},
-            "T": {"widget_type": "ToggleButton"},
-            "S": {"widget_type": "Slider"},
-            "D": {"widget_type": "Dropdown"},
-            "N": {"widget_type": "NumberPicker"},
-            "B": {"widget_type": "Button"},
-            "E": {"widget_type": "Entry"},
-            # Comment: used to display variables that end with _comment.
-            "C": {"widget_type": "Comment"}
-        }
-        self.widget_variables_list_comment = "Widget Variables Do Not Change"
-        self.widget_variables_category = self.widget_variables_list["-C-"]["widget_type"]
-        self.widget_variables_section = self.widget_variables_list["-S-"]["widget_type"]
-        self.widget_variables_label = self.widget_variables_list["L"]["widget_type"]
-        self.widget_variables_toggle_button = self.widget_variables_list["T"]["widget_type"]
-        self.widget_variables_slider = self.widget_variables_list["S"]["widget_type"]
-        self.widget_variables_dropdown = self.widget_variables_list["D"]["widget_type"]
-        self.widget_variables_number_picker = self.widget_variables_list["N"]["widget_type"]
-        self.widget_variables_button = self.widget_variables_list["B"]["widget_type"]
-        self.widget_variables_entry = self.widget_variables_list["E"]["widget_type"]
-        self.widget_variables_comment = self.widget_variables_list["C"]["widget_type"]
-        self.option_format = (
-            "self.widget_variables_list['{widget_variable}']['{option_name}'] = "
-            "'{option_value}'"
-        )
-        self.widget_variables_list["-C-"]["option_categories"] = [
-            "App Info", "App Settings"
-        ]
-        self.widget_variables_list["-S-"]["option_sections"] = [
-            "General", "Display", "Behavior", "Notifications", "Updates"
-        ]
-        self.option_categories = self.widget_variables_list["-C-"]["option_categories"]
-        self.option_sections = self.widget_variables_list["-S-"]["option_sections"]
-
-        # --- App Info (option_format: widget_variable, option_name, value) ---
-        self.widget_variables_list["C"]["app_info_comment"] = "App Information Do Not Change"
-        self.widget_variables_list["L"]["app_name"] = "Clock App"
-        self.widget_variables_list["L"]["app_version"] = "0.0.01"
-        self.widget_variables_list["L"]["app_version_type"] = "Pre-Alpha"
-        self.widget_variables_list["L"]["app_description"] = (
+# Widget type names, shared by every DefaultOptions instance
+WIDGET_TYPES = SimpleNamespace(
+    category="Category",
+    section="Section",
+    label="Label",
+    toggle_button="ToggleButton",
+    slider="Slider",
+    dropdown="Dropdown",
+    number_picker="NumberPicker",
+    button="Button",
+    entry="Entry",
+    comment="Comment",
+)
+
+# (category attribute, (widget_var, option_name) pairs) in options_dictionary order
+_CATEGORY_PLAN: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    ("app_info_category", (
+        ("C", "app_info_comment"), ("L", "app_name"), ("L", "app_version"),
+        ("L", "app_version_type"), ("L", "app_description"), ("L", "app_author"),
+        ("L", "app_author_github_username"), ("L", "app_github_url"),
+        ("L", "app_license"), ("L", "app_license_filename"), ("L", "app_license_url"),
+        ("L", "app_steam_id"), ("C", "steam_id_comment"),
+    )),
+    ("general_category", (
+        ("C", "supported_languages"), ("D", "app_language"),
+    )),
+    ("display_category", (
+        ("C", "supported_themes"), ("D", "app_theme"),
+        ("C", "supported_timezones"), ("D", "app_timezone"),
+        ("C", "supported_time_separators"), ("D", "app_time_separator"),
+        ("C", "supported_date_separators"), ("D", "app_date_separator"),
+        ("C", "app_time_comment"), ("T", "app_time_12_hour_format"),
+        ("E", "app_date_format"), ("C", "supported_date_formats"),
+    )),
+    ("behavior_category", (
+        ("C", "supported_clock_colors"), ("D", "app_clock_color"),
+        ("C", "supported_clock_fonts"), ("D", "app_clock_font"),
+        ("C", "supported_clock_font_sizes"), ("N", "app_clock_font_size"),
+    )),
+    ("notifications_category", (
+        ("C", "supported_notification_options"), ("T", "app_notification_option"),
+        ("C", "supported_notification_types"), ("D", "app_notification_type"),
+    )),
+    ("updates_category", (
+        ("C", "supported_update_options"), ("D", "app_update_option"),
+        ("C", "supported_update_channels"), ("D", "app_update_channel"),
+        ("C", "supported_update_check_frequencies"), ("D", "app_update_check_frequency"),
+        ("C", "update_check_time_comment"), ("L", "app_update_check_time"),
+        ("C", "supported_update_sources"), ("D", "app_update_source"),
+        ("C", "update_comment"),
+    )),
+)
+
+_CATEGORY_PAIRS: dict[str, tuple[tuple[str, str], ...]] = dict(_CATEGORY_PLAN)
+
+# Static defaults (widget_var -> option_name -> value), built once at import.
+# Authoring form only; lookups go through the flat _DEFAULT_OPTIONS below.
+_WIDGET_VARIABLES_LIST: dict[str, dict[str, Any]] = {
+    "-C-": {
+        "widget_type": "Category",
+        "option_categories": _OPTION_CATEGORIES,
+    },
+    "-S-": {
+        "widget_type": "Section",
+        "option_sections": _OPTION_SECTIONS,
+    },
+    "L": {
+        "widget_type": "Label",
+        # --- App Info ---
+        "app_name": "Clock App",
+        "app_version": "0.0.01",
+        "app_version_type": "Pre-Alpha",
+        "app_description": (
             "A simple clock app that displays the current time and date."
-        )
-        self.widget_variables_list["L"]["app_author"] = "Dramora9879"
-        self.widget_variables_list["L"]["app_author_github_username"] = "DramoraFramei"
-        self.widget_variables_list["L"]["app_github_url"] = "https://github.com/DramoraFramei/Clock-App"
-        self.widget_variables_list["L"]["app_license"] = "All Rights Reserved"
-        self.widget_variables_list["L"]["app_license_filename"] = "LICENSE"
-        self.widget_variables_list["L"]["app_license_url"] = (
+        ),
+        "app_author": "Dramora9879",
+        "app_author_github_username": "DramoraFramei",
+        "app_github_url": "https://github.com/DramoraFramei/Clock-App",
+        "app_license": "All Rights Reserved",
+        "app_license_filename": "LICENSE",
+        "app_license_url": (
             "https://github.com/DramoraFramei/Clock-App/blob/main/LICENSE"
-        )
-        self.widget_variables_list["L"]["app_steam_id"] = "${steam_id}"
-        self.widget_variables_list["C"]["steam_id_comment"] = "Steam ID is pulled from a separate file"
-
+        ),
+        "app_steam_id": "${steam_id}",
+        # --- Updates ---
+        "app_update_check_time": "Input Time in `${time_format}` format",
+    },
+    "T": {
+        "widget_type": "ToggleButton",
+        "app_time_12_hour_format": False,
+        "app_notification_option": "On",
+    },
+    "S": {"widget_type": "Slider"},
+    "D": {
+        "widget_type": "Dropdown",
+        "app_language": "English",
+        "app_theme": "Dark",
+        "app_timezone": "UTC",
+        "app_time_separator": ":",
+        "app_date_separator": "/",
+        "app_clock_color": "Black",
+        "app_clock_font": "Arial",
+        "app_notification_type": "Vibrate",
+        "app_update_option": "Automatic",
+        "app_update_channel": "Stable",
+        "app_update_check_frequency": "Daily",
+        "app_update_source": "GitHub",
+    },
+    "N": {
+        "widget_type": "NumberPicker",
+        "app_clock_font_size": 12,
+    },
+    "B": {"widget_type": "Button"},
+    "E": {
+        "widget_type": "Entry",
+        "app_date_format": "Choose a date format from the supported date formats",
+    },
+    # Comment: used to display variables that end with _comment.
+    "C": {
+        "widget_type": "Comment",
+        # --- App Info ---
+        "app_info_comment": "App Information Do Not Change",
+        "steam_id_comment": "Steam ID is pulled from a separate file",
         # --- General ---
-        self.widget_variables_list["C"]["supported_languages"] = [
-            "English",
-            "Arabic",
-            "French",
-            "German",
-            "Italian",
-            "Portuguese",
-            "Russian",
-            "Spanish",
-            "Turkish"
-        ]
-        self.widget_variables_list["D"]["app_language"] = "English"
-
+        "supported_languages": _SUPPORTED_LANGUAGES,
         # --- Display ---
-        self.widget_variables_list["C"]["supported_themes"] = ["Light", "Dark"]
-        self.widget_variables_list["D"]["app_theme"] = "Dark"
-        self.widget_variables_list["C"]["supported_timezones"] = [
-            "UTC", "GMT", "EST", "CST", "MST", "PST", "etc."
-        ]
-        self.widget_variables_list["D"]["app_timezone"] = "UTC"
-        self.widget_variables_list["C"]["supported_time_separators"] = [
-            ":", "-", ".", ":"]
-        self.widget_variables_list["D"]["app_time_separator"] = ":"
-        self.widget_variables_list["C"]["supported_date_separators"] = [
-            "/", "-", ".", ":"]
-        self.widget_variables_list["D"]["app_date_separator"] = "/"
-        self.widget_variables_list["C"]["app_time_comment"] = (
+        "supported_themes": _SUPPORTED_THEMES,
+        "supported_timezones": _SUPPORTED_TIMEZONES,
+        "supported_time_separators": _SUPPORTED_TIME_SEPARATORS,
+        "supported_date_separators": _SUPPORTED_DATE_SEPARATORS,
+        "app_time_comment": (
             "If True, the time will be displayed in 12 hour format, "
             "otherwise in 24 hour format"
-        )
-        self.widget_variables_list["T"]["app_time_12_hour_format"] = False
-        self.widget_variables_list["E"]["app_date_format"] = (
-            "Choose a date format from the supported date formats"
-        )
-        self.widget_variables_list["C"]["supported_date_formats"] = [
-            "'dd' {self.app_date_separator} 'mm' {self.app_date_separator} 'yyyy'",
-            "'mm' {self.app_date_separator} 'dd' {self.app_date_separator} 'yyyy'",
-            "'yyyy' {self.app_date_separator} 'mm' {self.app_date_separator} 'dd'",
-        ]
-
+        ),
+        "supported_date_formats": _SUPPORTED_DATE_FORMATS,
         # --- Behavior ---
-        self.widget_variables_list["C"]["supported_clock_colors"] = [
-            "Red", "Green", "Blue", "Yellow", "Purple", "Orange",
-            "Pink", "Brown", "Gray", "Black", "White"
-        ]
-        self.widget_variables_list["D"]["app_clock_color"] = "Black"
-        self.widget_variables_list["C"]["supported_clock_fonts"] = [
-            "Arial", "Times New Roman", "Courier New", "Verdana",
-        ]
-        self.widget_variables_list["D"]["app_clock_font"] = "Arial"
-        self.widget_variables_list["C"]["supported_clock_font_sizes"] = (
+        "supported_clock_colors": _SUPPORTED_CLOCK_COLORS,
+        "supported_clock_fonts": _SUPPORTED_CLOCK_FONTS,
+        "supported_clock_font_sizes": (
             "Choose a font size (If you are editing the ini file, you will need to input "
             "the font size instead of using the Number Picker. Minimum font size is 8 "
             "and maximum font size is 30)"
-        )
-        self.widget_variables_list["N"]["app_clock_font_size"] = 12
-
+        ),
         # --- Notifications ---
-        self.widget_variables_list["C"]["supported_notification_options"] = [
-            "On", "Off"]
-        self.widget_variables_list["T"]["app_notification_option"] = "On"
-        self.widget_variables_list["C"]["supported_notification_types"] = [
-            "Vibrate", "Sound", "Popup"
-        ]
-        self.widget_variables_list["D"]["app_notification_type"] = "Vibrate"
-
+        "supported_notification_options": _SUPPORTED_NOTIFICATION_OPTIONS,
+        "supported_notification_types": _SUPPORTED_NOTIFICATION_TYPES,
         # --- Updates ---
-        self.widget_variables_list["C"]["supported_update_options"] = [
-            "Automatic", "Manual"]
-        self.widget_variables_list["D"]["app_update_option"] = "Automatic"
-        self.widget_variables_list["C"]["supported_update_channels"] = [
-            "Stable", "Beta", "Dev"]
-        self.widget_variables_list["D"]["app_update_channel"] = "Stable"
-        self.widget_variables_list["C"]["supported_update_check_frequencies"] = [
-            "Daily", "Weekly", "Monthly"
-        ]
-        self.widget_variables_list["D"]["app_update_check_frequency"] = "Daily"
-        self.widget_variables_list["C"]["update_check_time_comment"] = (
+        "supported_update_options": _SUPPORTED_UPDATE_OPTIONS,
+        "supported_update_channels": _SUPPORTED_UPDATE_CHANNELS,
+        "supported_update_check_frequencies": _SUPPORTED_UPDATE_CHECK_FREQUENCIES,
+        "update_check_time_comment": (
             "The time at which the update check will be performed (If you are editing "
             "the ini file, you will need to input the time instead of using the Number "
             "Picker. Minimum time is 00:00 if using 24 hour format, 12:00 AM if using "
             "12 hour format and maximum time is 24:00 if using 24 hour format, 12:00 PM "
             "if using 12 hour format)"
-        )
-        self.widget_variables_list["L"]["app_update_check_time"] = (
-            "Input Time in `${time_format}` format"
-        )
-        self.widget_variables_list["C"]["supported_update_sources"] = [
-            "GitHub", "Stream", "Local"]
-        self.widget_variables_list["D"]["app_update_source"] = "GitHub"
-        self.widget_variables_list["C"]["update_comment"] = "Update Information Do Not Change"
-
-        # Build category dicts and options_dictionary from widget_variables_list.
-        def _gather_options(*key_pairs):
-            """(widget_var, option_name) -> category dict."""
-            out = {}
-            for wv, opt in key_pairs:
-                if opt in self.widget_variables_list.get(wv, {}):
-                    out[opt] = self.widget_variables_list[wv][opt]
-            return out
-
-        self.app_info_category = _gather_options(
-            ("C", "app_info_comment"), ("L", "app_name"), ("L", "app_version"),
-            ("L", "app_version_type"), ("L", "app_description"), ("L", "app_author"),
-            ("L", "app_author_github_username"), ("L", "app_github_url"),
-            ("L", "app_license"), ("L",
-                                   "app_license_filename"), ("L", "app_license_url"),
-            ("L", "app_steam_id"), ("C", "steam_id_comment"),
-        )
-        self.general_category = _gather_options(
-            ("C", "supported_languages"), ("D", "app_language"),
-        )
-        self.display_category = _gather_options(
-            ("C", "supported_themes"), ("D", "app_theme"),
-            ("C", "supported_timezones"), ("D", "app_timezone"),
-            ("C", "supported_time_separators"), ("D", "app_time_separator"),
-            ("C", "supported_date_separators"), ("D", "app_date_separator"),
-            ("C", "app_time_comment"), ("T", "app_time_12_hour_format"),
-            ("E", "app_date_format"), ("C", "supported_date_formats"),
-        )
-        self.behavior_category = _gather_options(
-            ("C", "supported_clock_colors"), ("D", "app_clock_color"),
-            ("C", "supported_clock_fonts"), ("D", "app_clock_font"),
-            ("C", "supported_clock_font_sizes"), ("N", "app_clock_font_size"),
-        )
-        self.notifications_category = _gather_options(
-            ("C", "supported_notification_options"), ("T", "app_notification_option"),
-            ("C", "supported_notification_types"), ("D", "app_notification_type"),
-        )
-        self.updates_category = _gather_options(
-            ("C", "supported_update_options"), ("D", "app_update_option"),
-            ("C", "supported_update_channels"), ("D", "app_update_channel"),
-            ("C", "supported_update_check_frequencies"), ("D",
-                                                          "app_update_check_frequency"),
-            ("C", "update_check_time_comment"), ("L", "app_update_check_time"),
-            ("C", "supported_update_sources"), ("D", "app_update_source"),
-            ("C", "update_comment"),
-        )
-        self.options_dictionary = [
-            self.app_info_category,
-            self.general_category,
-            self.display_category,
-            self.behavior_category,
-            self.notifications_category,
-            self.updates_category,
-        ]
+        ),
+        "supported_update_sources": _SUPPORTED_UPDATE_SOURCES,
+        "update_comment": "Update Information Do Not Change",
+    },
+}
+
+# (widget_var, option_name) -> value; one hash lookup per option read
+_DEFAULT_OPTIONS: dict[tuple[str, str], Any] = {
+    (wv, opt): value
+    for wv, opts in _WIDGET_VARIABLES_LIST.items()
+    for opt, value in opts.items()
+}
+
+
+def _gather_options(
+    options: dict[tuple[str, str], Any], pairs: tuple[tuple[str, str], ...]
+) -> dict[str, Any]:
+    """(widget_var, option_name) pairs -> category dict, skipping missing options."""
+    out = {}
+    for key in pairs:
+        if key in options:
+            out[key[1]] = options[key]
+    return out
+
+
+def _nest_options(options: dict[tuple[str, str], Any]) -> dict[str, dict[str, Any]]:
+    """Flat (widget_var, option_name) options -> {widget_var: {option_name: value}}."""
+    nested: dict[str, dict[str, Any]] = {}
+    for (wv, opt), value in options.items():
+        nested.setdefault(wv, {})[opt] = value
+    return nested
+
+
+class DefaultOptions:
+    """
+    This is the default options class for the clock app.
+    It will contain the default options for the clock app.
+    """
+
+    __slots__ = (
+        "options",
+        "widget_variables_list_comment",
+        "widget_types",
+        "option_categories",
+        "option_sections",
+        # Filled on first access by __getattr__
+        "widget_variables_list",
+        *_CATEGORY_PAIRS,
+        "options_dictionary",
+    )
+
+    def __init__(self):
+        self.options: dict[tuple[str, str], Any] = dict(_DEFAULT_OPTIONS)
+        self.widget_variables_list_comment = "Widget Variables Do Not Change"
+        self.widget_types = WIDGET_TYPES
+        self.option_categories = _OPTION_CATEGORIES
+        self.option_sections = _OPTION_SECTIONS
+
+    def __getattr__(self, name: str) -> Any:
+        """Build the nested view, *_category dicts and options_dictionary on first access."""
+        pairs = _CATEGORY_PAIRS.get(name)
+        if pairs is not None:
+            # Read-only view: consumers can share it without defensive copies
+            value: Any = MappingProxyType(_gather_options(self.options, pairs))
+        elif name == "widget_variables_list":
+            value = _nest_options(self.options)
+        elif name == "options_dictionary":
+            value = tuple(getattr(self, attr) for attr, _pairs in _CATEGORY_PLAN)
+        else:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}")
+        setattr(self, name, value)
+        return value
+
+
+@lru_cache(maxsize=1)
+def get_default_options() -> DefaultOptions:
+    """Return the shared DefaultOptions, built on first call. Treat it as read-only."""
+    return DefaultOptions()
+
+
+def reload_defaults() -> None:
+    """Drop the shared DefaultOptions so the next get_default_options() rebuilds it."""
+    get_default_options.cache_clear()
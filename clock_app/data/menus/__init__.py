@@ -1,15 +1,20 @@
 # Auto-generated __init__.py
 
-from . import clock
-from .clock import Clock
-from . import console
-from .console import Console
-from . import loading
-from .loading import Loading
-from . import main
-from .main import MainMenu
-from . import options
-from .options import Options
+from importlib import import_module
+
+# Public name -> submodule defining it; submodules are imported on first access
+_LAZY_ATTRS: dict[str, str] = {
+    "clock": "clock",
+    "console": "console",
+    "loading": "loading",
+    "main": "main",
+    "options": "options",
+    "Clock": "clock",
+    "Console": "console",
+    "Loading": "loading",
+    "MainMenu": "main",
+    "Options": "options",
+}
 
 __all__ = [
     "clock",
@@ -23,3 +28,19 @@ __all__ = [
     "MainMenu",
     "Options",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule behind name on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{module_name}", __name__)
+    value = module if name == module_name else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names."""
+    return list(__all__)
@@ -7,75 +7,119 @@ Shows analog or digital clock based on clock_app.ini configuration.
 
 from __future__ import annotations
 
-import configparser
-import json
 import math
 import os
+import time
 import tkinter as tk
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from tkinter import ttk
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from ... import fast_ini
 from ...assets.lib.lang.translator import t
 
 if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+
     from ...imports import ClockApp
 
 
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# Pillow is imported on first analog use by _load_pil(); digital mode never needs it
+Image: Any = None
+ImageTk: Any = None
+HAS_PIL: bool | None = None
+
+
+def _load_pil() -> bool:
+    """Import Pillow once, binding Image/ImageTk; return whether it is available."""
+    global Image, ImageTk, HAS_PIL
+    if HAS_PIL is None:
+        try:
+            from PIL import Image, ImageTk
+            HAS_PIL = True
+        except ImportError:
+            HAS_PIL = False
+    return HAS_PIL
 
 
 # Map common timezone abbreviations to IANA zone names
-_TZ_ABBREV_TO_IANA: dict[str, str] = {
+_TZ_ABBREV_TO_IANA: MappingProxyType[str, str] = MappingProxyType({
     "UTC": "UTC",
     "GMT": "Etc/GMT",
     "EST": "America/New_York",
     "CST": "America/Chicago",
     "MST": "America/Denver",
     "PST": "America/Los_Angeles",
-}
+})
+
+
+@lru_cache(maxsize=64)
+def _cached_zoneinfo(name: str) -> ZoneInfo | None:
+    """Return ZoneInfo for an IANA name, or None if unknown; tzdata is read once per name."""
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
 
 
 def _resolve_timezone(abbrev: str) -> ZoneInfo | None:
     """Resolve timezone abbreviation or IANA name to ZoneInfo."""
-    if not abbrev or not abbrev.strip():
-        return None
-    key = abbrev.strip().upper()
-    iana = _TZ_ABBREV_TO_IANA.get(key)
-    if iana:
-        return ZoneInfo(iana)
-    try:
-        return ZoneInfo(abbrev.strip())
-    except ZoneInfoNotFoundError:
+    name = abbrev.strip() if abbrev else ""
+    if not name:
         return None
+    return _cached_zoneinfo(_TZ_ABBREV_TO_IANA.get(name.upper(), name))
 
 
-def _load_clock_config(ini_path: str) -> dict[str, Any]:
-    """Load clock-related config from clock_app.ini."""
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(ini_path, encoding="utf-8")
-    out: dict[str, Any] = {
-        "animation": False,
-        "clock_type": "Digital",
-        "clock_color": "Black",
-        "use_12_hour": False,
-        "time_separator": ":",
-        "timezone": None,
-        "clock_font": "Arial",
-        "clock_font_size": 12,
-    }
+@dataclass(frozen=True)
+class ClockConfig:
+    """Clock settings read from clock_app.ini. Immutable, so cached copies are shared."""
+
+    animation: bool = False
+    clock_type: str = "Digital"
+    clock_color: str = "Black"
+    use_12_hour: bool = False
+    time_separator: str = ":"
+    timezone: ZoneInfo | None = None
+    clock_font: str = "Arial"
+    clock_font_size: int = 12
+
+    @property
+    def use_digital(self) -> bool:
+        """True when the digital display should be shown instead of the analog one."""
+        return not self.animation and self.clock_type == "Digital"
+
+
+# ini path -> (st_mtime_ns, parsed clock config)
+_CONFIG_CACHE: dict[str, tuple[int, ClockConfig]] = {}
+
+
+def _load_clock_config(ini_path: str) -> ClockConfig:
+    """Load clock-related config from clock_app.ini; reparse only when mtime changes."""
+    try:
+        mtime = os.stat(ini_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _CONFIG_CACHE.get(ini_path)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+    cfg = _parse_clock_config(ini_path)
+    if mtime is not None:
+        _CONFIG_CACHE[ini_path] = (mtime, cfg)
+    return cfg
+
+
+def _parse_clock_config(ini_path: str) -> ClockConfig:
+    """Parse clock-related config from clock_app.ini."""
+    ini = fast_ini.load(ini_path)
+    out: dict[str, Any] = {}
     for sect in ["-S- Display", "-S- Behavior"]:
-        if not cfg.has_section(sect):
-            continue
-        for key in cfg.options(sect):
+        for key, val in ini.get(sect, {}).items():
             name = key.split(".", 1)[-1] if "." in key else key
-            val = cfg.get(sect, key).strip()
+            val = val.strip()
             if name in ("app_animation_option", "app_clock_animation"):
                 out["animation"] = val.lower() in ("true", "1", "yes", "on")
             elif name == "app_clock_type":
@@ -96,7 +140,7 @@ def _load_clock_config(ini_path: str) -> dict[str, Any]:
                     out["clock_font_size"] = int(float(val))
                 except (ValueError, TypeError):
                     pass
-    return out
+    return ClockConfig(**out)
 
 
 # Default pivots: hour/minute = center of white circle, aligned with clock face center
@@ -107,6 +151,21 @@ DEFAULT_HAND_PIVOTS: dict[str, str | tuple[float, float]] = {
     "second": "bottom",
 }
 
+# Hand length as a fraction of the clock radius
+_HAND_SCALE_FACTORS: dict[str, float] = {"hour": 0.4, "minute": 0.5, "second": 0.55}
+
+# Rotated second-hand photos kept per Clock (at most one per half-degree step)
+_SECOND_HAND_CACHE_LIMIT = 720
+
+# UTC offsets are rechecked on this epoch grid (DST changes fall on quarter hours)
+_TZ_OFFSET_RECHECK_SEC = 900
+
+# Canvas <Configure> events within this window collapse into one redraw
+_RESIZE_DEBOUNCE_MS = 50
+
+# Second-hand frames pre-rendered per idle callback
+_SECOND_WARMUP_BATCH = 6
+
 
 class Clock(ttk.Frame):
     """
@@ -120,19 +179,27 @@ class Clock(ttk.Frame):
 
         self._ini_path = CLOCK_APP_INI_PATH
         self._images_folder = IMAGES_FOLDER
+        self._images_index: dict[str, str] | None = None
         self._config = _load_clock_config(self._ini_path)
-        self._use_digital = (
-            not self._config.get("animation", True)
-            and self._config.get("clock_type", "Analog") == "Digital"
-        )
-        self._clock_color = self._config.get("clock_color", "Black")
-        self._use_12_hour = self._config.get("use_12_hour", False)
-        self._time_sep = self._config.get("time_separator", ":")
-        self._font_name = self._config.get("clock_font", "Arial")
-        self._font_size = self._config.get("clock_font_size", 12)
-        self._tz = self._config.get("timezone")
-        self._analog_animation_enabled = self._config.get("animation", True)
+        self._use_digital = self._config.use_digital
+        self._tz_offset_sec = 0.0
+        self._tz_offset_expiry = 0.0
+        self._analog_animation_enabled = self._config.animation
         self._photo_refs: list[Any] = []
+        # Display widgets and analog assets; None/empty until built or loaded
+        self._clock_canvas: tk.Canvas | None = None
+        self._time_label: tk.Label | None = None
+        self._hand_images: dict[str, Image.Image | None] = {}
+        self._hand_img_max_dim: dict[str, int] = {}
+        # (size, photo) of the face at the current size; one at a time so resizes free the old one
+        self._face_photo: tuple[int, ImageTk.PhotoImage] | None = None
+        # Persistent face/hand canvas items, updated in place via coords/itemconfigure
+        self._canvas_items: dict[str, int] = {}
+        # element name -> (photo, x, y) currently shown by its canvas item
+        self._drawn_items: dict[str, tuple[Any, int, int]] = {}
+        # Inputs of the last hand draw; an identical tick is skipped outright
+        self._last_hand_state: tuple | None = None
+        self._last_drawn_sec: int | None = None
         self._drag_drop: dict[str, bool] = {}
         self._element_offsets: dict[str, tuple[int, int]] = {}
         self._element_scale_override: dict[str, float] = {}
@@ -141,10 +208,24 @@ class Clock(ttk.Frame):
         self._pivots_path = os.path.join(
             os.path.dirname(self._ini_path), "clock_pivots.json"
         )
+        # Set when pivots/offsets change; _save_hand_pivots writes only then
+        self._pivots_dirty = False
         self._resize_mode_element: str | None = None
         self._drag_target: str | None = None
         self._drag_start: tuple[int, int] = (0, 0)
         self._last_canvas_size: tuple[int, int] | None = None
+        self._resize_after_id: str | None = None
+        # (name, radius, scale, pivot) -> (scaled image, pivot_x, pivot_y)
+        self._scaled_hand_cache: dict[tuple, tuple[Any, int, int]] = {}
+        # Second hand: scaled key + quantized angle -> (rotated photo, pivot_x, pivot_y); FIFO-capped.
+        # Its 60 tick frames repeat every minute, so it keeps the full circle.
+        self._hand_cache: dict[tuple, tuple[Any, int, int]] = {}
+        # Hour/minute: name -> (key, rotated result) of the last frame only; a frame is
+        # reused until the hand steps half a degree and not again for an hour or more
+        self._last_hand_frame: dict[str, tuple[tuple, tuple[Any, int, int]]] = {}
+        # Bumped on every cache clear so stale warm-up batches stop
+        self._hand_cache_generation = 0
+        self._second_warmup_key: tuple | None = None
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
         self._load_hand_pivots()
@@ -164,32 +245,79 @@ class Clock(ttk.Frame):
     def refresh_translations(self) -> None:
         """Update labels and canvas text with current language."""
         self.back_button.config(text=t("common.back"))
-        if not self._use_digital and hasattr(self, "_clock_canvas"):
+        if not self._use_digital and self._clock_canvas is not None:
             self._draw_analog_clock()
 
     def _find_image_path(self, base_name: str) -> str | None:
         """Return path to image; prefer jpg then tif then png for analog assets."""
+        if self._images_index is None:
+            # One directory scan instead of an exists() call per candidate name; keyed by the
+            # lowercased file name so lookups stay case-insensitive as on Windows/macOS
+            try:
+                with os.scandir(self._images_folder) as entries:
+                    self._images_index = {
+                        e.name.lower(): e.path for e in entries if e.is_file()
+                    }
+            except OSError:
+                self._images_index = {}
         for ext in (".jpg", ".jpeg", ".tif", ".tiff", ".png"):
-            path = os.path.join(self._images_folder, base_name + ext)
-            if os.path.exists(path):
+            path = self._images_index.get((base_name + ext).lower())
+            if path is not None:
                 return path
         return None
 
     def _load_analog_assets(self) -> None:
         """Load analog clock face and hand images once; reuse for drawing."""
-        if not HAS_PIL:
+        if not _load_pil():
             return
         names = ("analog_clock", "analog_clock_hour_hand",
                  "analog_clock_minute_hand", "analog_clock_second_hand")
         keys = ("face", "hour", "minute", "second")
-        self._hand_images: dict[str, Image.Image] = {}
+        self._hand_images = {}
         for key, base in zip(keys, names):
             path = self._find_image_path(base)
             if path:
                 self._hand_images[key] = Image.open(path).convert("RGBA")
             else:
                 self._hand_images[key] = None
-        self._face_cache: dict[int, Image.Image] = {}
+        self._hand_img_max_dim = {
+            key: max(1, img.width, img.height)
+            for key, img in self._hand_images.items()
+            if img is not None
+        }
+        self._face_photo = None
+        self._clear_hand_cache()
+
+    def _clear_hand_cache(self) -> None:
+        """Drop cached scaled/rotated hands after size, scale, pivot or asset changes."""
+        self._scaled_hand_cache.clear()
+        self._hand_cache.clear()
+        self._last_hand_frame.clear()
+        self._hand_cache_generation += 1
+        self._second_warmup_key = None
+
+    def _schedule_second_hand_warmup(self, radius: int) -> None:
+        """Pre-render the 60 whole-second second-hand frames in idle batches."""
+        rot_add = self._element_rotation_override.get("second", 0)
+        key = (radius, rot_add, self._hand_cache_generation)
+        if self._second_warmup_key == key or self._hand_images.get("second") is None:
+            return
+        self._second_warmup_key = key
+        second = int(self._local_seconds()) % 60
+        # Start at the upcoming ticks so they hit the cache first
+        positions = [(second + i) % 60 for i in range(1, 61)]
+        self.after_idle(self._warm_second_hand, key, positions)
+
+    def _warm_second_hand(self, key: tuple, positions: list[int]) -> None:
+        """Render one batch of second-hand frames into the rotation cache."""
+        if key != self._second_warmup_key:
+            return
+        radius, rot_add, _generation = key
+        for sec in positions[:_SECOND_WARMUP_BATCH]:
+            self._rotated_hand("second", sec * 6 + rot_add, radius)
+        rest = positions[_SECOND_WARMUP_BATCH:]
+        if rest:
+            self.after_idle(self._warm_second_hand, key, rest)
 
     def _get_clock_dimensions(self) -> tuple[int, int, int]:
         """Return (radius, center_x, center_y) to fit the clock in the canvas."""
@@ -204,100 +332,145 @@ class Clock(ttk.Frame):
         center_y = h // 2
         return radius, center_x, center_y
 
-    def _rotated_hand(
-        self, name: str, angle_deg: float, radius: int
-    ) -> tuple[ImageTk.PhotoImage, int, int] | None:
-        """Return (rotated hand photo, pivot_x, pivot_y) in rotated image. Pivot at clock center."""
-        img = self._hand_images.get(name)
-        if img is None:
-            return None
-        scale_factors = {"hour": 0.4, "minute": 0.5, "second": 0.55}
-        base_scale = radius * scale_factors.get(name, 0.5)
-        override = self._element_scale_override.get(name, 1.0)
-        target_len = base_scale * override
-        scale = target_len / max(1, max(img.width, img.height))
+    def _hand_geometry(
+        self,
+        name: str,
+        img: Image.Image,
+        radius: int,
+        override: float,
+        pivot_spec: str | tuple[float, float],
+    ) -> tuple[int, int, int, int]:
+        """Return (new_w, new_h, pivot_x, pivot_y) of a hand scaled for radius."""
+        target_len = radius * _HAND_SCALE_FACTORS.get(name, 0.5) * override
+        scale = target_len / self._hand_img_max_dim[name]
         new_w = max(1, int(img.width * scale))
         new_h = max(1, int(img.height * scale))
-        scaled = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-        pivot_spec = self._hand_pivots.get(name) or DEFAULT_HAND_PIVOTS.get(
-            name, "center"
-        )
         if pivot_spec == "bottom":
-            px, py = new_w // 2, new_h - 1
-        elif isinstance(pivot_spec, tuple):
+            return new_w, new_h, new_w // 2, new_h - 1
+        if isinstance(pivot_spec, tuple):
             xr, yr = pivot_spec
-            px, py = int(new_w * xr), int(new_h * yr)
-        else:
-            px, py = new_w // 2, new_h // 2
-        rotated = scaled.rotate(
-            -angle_deg,
-            resample=Image.BICUBIC,
-            expand=True,
-            center=(px, py),
-            fillcolor=(0, 0, 0, 0),
-        )
-        # Pivot in rotated image: bbox of rotated corners
-        corners = [(0, 0), (new_w, 0), (new_w, new_h), (0, new_h)]
-        cos_a = math.cos(math.radians(angle_deg))
-        sin_a = math.sin(math.radians(angle_deg))
-        rx = [int((c[0] - px) * cos_a - (c[1] - py) * sin_a + px) for c in corners]
-        ry = [int((c[0] - px) * sin_a + (c[1] - py) * cos_a + py) for c in corners]
-        min_x, min_y = min(rx), min(ry)
-        pivot_out_x = px - min_x
-        pivot_out_y = py - min_y
-        return ImageTk.PhotoImage(rotated), pivot_out_x, pivot_out_y
-
-    def _get_hand_transform_info(
+            return new_w, new_h, int(new_w * xr), int(new_h * yr)
+        return new_w, new_h, new_w // 2, new_h // 2
+
+    def _scaled_hand(
         self, name: str, radius: int
-    ) -> tuple[int, int, int, int, float] | None:
-        """Return (new_w, new_h, pivot_x, pivot_y, angle_deg) for a hand."""
-        img = self._hand_images.get(name) if hasattr(
-            self, "_hand_images") else None
+    ) -> tuple[tuple, Image.Image, int, int] | None:
+        """Return (cache key, scaled hand image, pivot_x, pivot_y); resized once per key."""
+        img = self._hand_images.get(name)
         if img is None:
             return None
-        scale_factors = {"hour": 0.4, "minute": 0.5, "second": 0.55}
-        base_scale = radius * scale_factors.get(name, 0.5)
         override = self._element_scale_override.get(name, 1.0)
-        target_len = base_scale * override
-        scale = target_len / max(1, max(img.width, img.height))
-        new_w = max(1, int(img.width * scale))
-        new_h = max(1, int(img.height * scale))
         pivot_spec = self._hand_pivots.get(name) or DEFAULT_HAND_PIVOTS.get(
             name, "center"
         )
-        if pivot_spec == "bottom":
-            pivot = (new_w // 2, new_h - 1)
-        elif isinstance(pivot_spec, tuple):
-            xr, yr = pivot_spec
-            pivot = (int(new_w * xr), int(new_h * yr))
+        key = (name, radius, override, pivot_spec)
+        cached = self._scaled_hand_cache.get(key)
+        if cached is not None:
+            return (key, *cached)
+        new_w, new_h, px, py = self._hand_geometry(
+            name, img, radius, override, pivot_spec)
+        scaled = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        self._scaled_hand_cache[key] = (scaled, px, py)
+        return key, scaled, px, py
+
+    def _rotated_hand(
+        self, name: str, angle_deg: float, radius: int
+    ) -> tuple[ImageTk.PhotoImage, int, int] | None:
+        """Return (rotated hand photo, pivot_x, pivot_y) in rotated image. Pivot at clock center."""
+        scaled_info = self._scaled_hand(name, radius)
+        if scaled_info is None:
+            return None
+        scaled_key, scaled, px, py = scaled_info
+        # Half-degree steps are indistinguishable on screen and bound the cache size
+        angle_deg = round(angle_deg * 2) / 2 % 360
+        key = (*scaled_key, angle_deg)
+        if name == "second":
+            cached = self._hand_cache.get(key)
         else:
-            pivot = (new_w // 2, new_h // 2)
-        now = datetime.now(self._tz) if self._tz else datetime.now()
-        sec = now.second + now.microsecond / 1_000_000
-        min_val = now.minute + sec / 60
-        if self._use_12_hour:
-            hr = (now.hour % 12) + min_val / 60
-            hr = hr % 12
+            last = self._last_hand_frame.get(name)
+            cached = last[1] if last is not None and last[0] == key else None
+        if cached is not None:
+            return cached
+        new_w, new_h = scaled.size
+        # Right angles: lossless transpose (clockwise), pivot mapped exactly
+        if angle_deg == 0:
+            rotated, pivot_out_x, pivot_out_y = scaled, px, py
+        elif angle_deg == 90:
+            rotated = scaled.transpose(Image.Transpose.ROTATE_270)
+            pivot_out_x, pivot_out_y = new_h - py, px
+        elif angle_deg == 180:
+            rotated = scaled.transpose(Image.Transpose.ROTATE_180)
+            pivot_out_x, pivot_out_y = new_w - px, new_h - py
+        elif angle_deg == 270:
+            rotated = scaled.transpose(Image.Transpose.ROTATE_90)
+            pivot_out_x, pivot_out_y = py, new_w - px
         else:
-            hr = (now.hour % 24) + min_val / 60
-        sec_angle = sec * 6
-        min_angle = min_val * 6
-        hr_angle = hr * 30 if self._use_12_hour else hr * 15
-        angles = {"hour": hr_angle, "minute": min_angle, "second": sec_angle}
-        angle = angles.get(name, 0) + self._element_rotation_override.get(
-            name, 0
-        )
-        return (new_w, new_h, pivot[0], pivot[1], angle)
+            rotated = scaled.rotate(
+                -angle_deg,
+                # The second hand is thin and redrawn every tick; bilinear looks the same
+                resample=(Image.Resampling.BILINEAR if name == "second"
+                          else Image.Resampling.BICUBIC),
+                expand=True,
+                center=(px, py),
+                fillcolor=(0, 0, 0, 0),
+            )
+            # Pivot in rotated image: x and y terms of the rotated corners are
+            # independent, so the bbox minimum is a sum of per-axis minimums
+            rad = math.radians(angle_deg)
+            cos_a, sin_a = math.cos(rad), math.sin(rad)
+            min_x = (px + min(-px * cos_a, (new_w - px) * cos_a)
+                     + min(py * sin_a, (py - new_h) * sin_a))
+            min_y = (py + min(-px * sin_a, (new_w - px) * sin_a)
+                     + min(-py * cos_a, (new_h - py) * cos_a))
+            pivot_out_x = px - int(min_x)
+            pivot_out_y = py - int(min_y)
+        result = (ImageTk.PhotoImage(rotated), pivot_out_x, pivot_out_y)
+        if name != "second":
+            self._last_hand_frame[name] = (key, result)
+            return result
+        if len(self._hand_cache) >= _SECOND_HAND_CACHE_LIMIT:
+            del self._hand_cache[next(iter(self._hand_cache))]
+        self._hand_cache[key] = result
+        return result
+
+    def _hand_angles(self) -> dict[str, float]:
+        """
+        Return time-based angles for hour, minute and second hands from one clock read.
+        Second 6°/sec, minute 6°/min + 0.1°/sec, hour 30°/hr + 0.5°/min (15°/hr in 24-hour mode).
+        """
+        sec_of_day = self._local_seconds() % 86400
+        sec = sec_of_day % 60
+        min_val = (sec_of_day % 3600) / 60
+        hr = sec_of_day / 3600
+        hr_angle = (hr % 12) * 30 if self._config.use_12_hour else hr * 15
+        return {"hour": hr_angle, "minute": min_val * 6, "second": sec * 6}
+
+    def _local_seconds(self) -> float:
+        """Return time.time() shifted to the configured zone (local time if none)."""
+        now = time.time()
+        if now >= self._tz_offset_expiry:
+            tz = self._config.timezone
+            if tz is not None:
+                offset = datetime.fromtimestamp(now, tz).utcoffset()
+                self._tz_offset_sec = offset.total_seconds() if offset else 0.0
+            else:
+                self._tz_offset_sec = float(time.localtime(now).tm_gmtoff)
+            self._tz_offset_expiry = (
+                now // _TZ_OFFSET_RECHECK_SEC + 1) * _TZ_OFFSET_RECHECK_SEC
+        return now + self._tz_offset_sec
 
     def _compute_pivot_from_offset(
         self, name: str, dx: int, dy: int
     ) -> tuple[float, float] | None:
         """Compute new pivot so the point at clock center becomes the pivot."""
         radius, _, _ = self._get_clock_dimensions()
-        info = self._get_hand_transform_info(name, radius)
-        if info is None:
+        scaled_info = self._scaled_hand(name, radius)
+        if scaled_info is None:
             return None
-        new_w, new_h, pivot_x, pivot_y, angle_deg = info
+        _key, scaled, pivot_x, pivot_y = scaled_info
+        new_w, new_h = scaled.size
+        angle_deg = self._hand_angles().get(name, 0)
+        angle_deg += self._element_rotation_override.get(name, 0)
         # Vector from hand center to clock center in canvas coords: (-dx, -dy)
         # PIL rotates by -angle; inverse is +angle
         angle_rad = math.radians(angle_deg)
@@ -313,6 +486,7 @@ class Clock(ttk.Frame):
         """Load hand pivots and offsets from clock_pivots.json."""
         if not os.path.exists(self._pivots_path):
             return
+        import json
         try:
             with open(self._pivots_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -335,7 +509,10 @@ class Clock(ttk.Frame):
             pass
 
     def _save_hand_pivots(self) -> None:
-        """Save hand pivots and offsets to clock_pivots.json."""
+        """Save hand pivots and offsets to clock_pivots.json if they changed."""
+        if not self._pivots_dirty:
+            return
+        import json
         data: dict[str, Any] = {}
         for key in ("hour", "minute", "second"):
             spec = self._hand_pivots.get(key)
@@ -348,32 +525,50 @@ class Clock(ttk.Frame):
             key: list(self._element_offsets.get(key, (0, 0)))
             for key in ("hour", "minute", "second")
         }
+        tmp_path = self._pivots_path + ".tmp"
         try:
-            with open(self._pivots_path, "w", encoding="utf-8") as f:
+            # Write aside then swap in, so a crash never leaves a truncated file
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self._pivots_path)
         except OSError:
-            pass
+            return
+        self._pivots_dirty = False
 
     def _on_canvas_configure(self, event: tk.Event) -> None:
+        """Debounce resize handling while the window is being dragged."""
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(
+            _RESIZE_DEBOUNCE_MS, self._do_canvas_resize,
+            max(1, event.width), max(1, event.height),
+        )
+
+    def _do_canvas_resize(self, new_w: int, new_h: int) -> None:
         """Scale offsets on resize so pivots stay aligned; redraw; persist."""
-        new_w = max(1, event.width)
-        new_h = max(1, event.height)
-        if self._last_canvas_size is not None:
-            old_w, old_h = self._last_canvas_size
-            if old_w > 0 and old_h > 0:
-                scale_x = new_w / old_w
-                scale_y = new_h / old_h
-                for key in ("face", "hour", "minute", "second"):
-                    dx, dy = self._element_offsets.get(key, (0, 0))
-                    if (dx, dy) != (0, 0):
-                        self._element_offsets[key] = (
-                            int(round(dx * scale_x)),
-                            int(round(dy * scale_y)),
-                        )
-                self._save_hand_pivots()
-        self._last_canvas_size = (new_w, new_h)
+        self._resize_after_id = None
+        if self._clock_canvas is None:
+            return
+        if self._last_canvas_size != (new_w, new_h):
+            if self._last_canvas_size is not None:
+                self._scale_offsets(new_w, new_h)
+            self._last_canvas_size = (new_w, new_h)
+            self._clear_hand_cache()
         self._draw_analog_clock()
 
+    def _scale_offsets(self, new_w: int, new_h: int) -> None:
+        """Scale dragged offsets from the last canvas size; persist if any moved."""
+        old_w, old_h = self._last_canvas_size
+        scale_x = new_w / old_w
+        scale_y = new_h / old_h
+        offsets = self._element_offsets
+        for key in ("face", "hour", "minute", "second"):
+            dx, dy = offsets.get(key, (0, 0))
+            if (dx, dy) != (0, 0):
+                offsets[key] = (int(round(dx * scale_x)), int(round(dy * scale_y)))
+                self._pivots_dirty = True
+        self._save_hand_pivots()
+
     def _on_canvas_click(self, event: tk.Event) -> None:
         """Start drag if clicking on a draggable element."""
         items = self._clock_canvas.find_overlapping(
@@ -397,6 +592,8 @@ class Clock(ttk.Frame):
         dy = event.y - self._drag_start[1]
         ox, oy = self._element_offsets.get(self._drag_target, (0, 0))
         self._element_offsets[self._drag_target] = (ox + dx, oy + dy)
+        if dx or dy:
+            self._pivots_dirty = True
         self._drag_start = (event.x, event.y)
         _r, center_x, center_y = self._get_clock_dimensions()
         nx = center_x + ox + dx
@@ -414,17 +611,17 @@ class Clock(ttk.Frame):
         if not enabled and element in ("hour", "minute", "second"):
             dx, dy = self._element_offsets.get(element, (0, 0))
             if (dx, dy) != (0, 0) and not self._use_digital:
-                if hasattr(self, "_clock_canvas") and hasattr(
-                    self, "_hand_images"
-                ):
+                if self._clock_canvas is not None:
                     new_pivot = self._compute_pivot_from_offset(
                         element, dx, dy)
                     if new_pivot is not None:
                         self._hand_pivots[element] = new_pivot
                         self._element_offsets[element] = (0, 0)  # reset offset
+                        self._pivots_dirty = True
+                        self._clear_hand_cache()
             if not self._use_digital:
                 self._save_hand_pivots()
-                if hasattr(self, "_clock_canvas"):
+                if self._clock_canvas is not None:
                     self._draw_analog_clock()
 
     def set_analog_animation(self, enabled: bool) -> None:
@@ -434,6 +631,7 @@ class Clock(ttk.Frame):
     def set_element_scale(self, element: str, scale: float) -> None:
         """Set scale multiplier for an element (1.0 = default)."""
         self._element_scale_override[element] = max(0.1, scale)
+        self._clear_hand_cache()
 
     def set_element_rotation(self, element: str, degrees: float) -> None:
         """Set rotation override for an element (added to time-based rotation)."""
@@ -444,10 +642,14 @@ class Clock(ttk.Frame):
     ) -> None:
         """Set pivot for hand: 'center', 'bottom', or (x_ratio, y_ratio) 0-1."""
         self._hand_pivots[element] = pivot
+        self._pivots_dirty = True
+        self._clear_hand_cache()
 
     def set_resize_mode(self, element: str, enabled: bool) -> None:
         """Enable/disable resize mode for element. Use =/+ and -/_ keys when enabled."""
         self._resize_mode_element = element if enabled else None
+        if hasattr(self.parent, "set_resize_keys_enabled"):
+            self.parent.set_resize_keys_enabled(enabled)
 
     def adjust_resize_scale(self, delta: float) -> bool:
         """Adjust scale of element in resize mode. Returns True if handled."""
@@ -457,7 +659,8 @@ class Clock(ttk.Frame):
         current = self._element_scale_override.get(elem, 1.0)
         new_val = max(0.1, min(5.0, current + delta))
         self._element_scale_override[elem] = new_val
-        if not self._use_digital and hasattr(self, "_clock_canvas"):
+        self._clear_hand_cache()
+        if not self._use_digital and self._clock_canvas is not None:
             self._draw_analog_clock()
         return True
 
@@ -467,46 +670,43 @@ class Clock(ttk.Frame):
 
     def _refresh_on_show(self) -> None:
         """Reload config from ini; rebuild display if clock type (analog/digital) changed."""
-        self._config = _load_clock_config(self._ini_path)
-        new_use_digital = (
-            not self._config.get("animation", True)
-            and self._config.get("clock_type", "Analog") == "Digital"
-        )
-        self._clock_color = self._config.get("clock_color", "Black")
-        self._use_12_hour = self._config.get("use_12_hour", False)
-        self._time_sep = self._config.get("time_separator", ":")
-        self._font_name = self._config.get("clock_font", "Arial")
-        self._font_size = self._config.get("clock_font_size", 12)
-        self._tz = self._config.get("timezone")
-        self._analog_animation_enabled = self._config.get("animation", True)
+        cfg = _load_clock_config(self._ini_path)
+        if cfg.timezone != self._config.timezone:
+            self._tz_offset_expiry = 0.0
+        self._config = cfg
+        new_use_digital = cfg.use_digital
+        self._analog_animation_enabled = cfg.animation
         if new_use_digital != self._use_digital:
             self._use_digital = new_use_digital
             self._destroy_clock_display()
             self._build_clock_display()
-        elif self._use_digital and hasattr(self, "_time_label"):
+        elif self._use_digital and self._time_label is not None:
             self._time_label.config(
-                font=(self._font_name, self._font_size, "bold"),
-                fg=self._clock_color,
+                font=(self._config.clock_font, self._config.clock_font_size, "bold"),
+                fg=self._config.clock_color,
             )
-        elif not self._use_digital and hasattr(self, "_clock_canvas"):
+        elif not self._use_digital and self._clock_canvas is not None:
             self._draw_analog_clock()
 
     def refresh_theme_colors(self) -> None:
         """Apply current app theme colors (bg/fg only)."""
         bg = self._theme_bg()
-        if hasattr(self, "_time_label") and self._time_label.winfo_exists():
+        if self._time_label is not None and self._time_label.winfo_exists():
             self._time_label.configure(bg=bg)
-        if hasattr(self, "_clock_canvas") and self._clock_canvas.winfo_exists():
+        if self._clock_canvas is not None and self._clock_canvas.winfo_exists():
             self._clock_canvas.configure(bg=bg)
 
     def _destroy_clock_display(self) -> None:
         """Destroy the current clock display widget (analog canvas or digital label)."""
-        if hasattr(self, "_clock_canvas") and self._clock_canvas.winfo_exists():
-            self._clock_canvas.destroy()
-            del self._clock_canvas
-        if hasattr(self, "_time_label") and self._time_label.winfo_exists():
-            self._time_label.destroy()
-            del self._time_label
+        if self._clock_canvas is not None:
+            if self._clock_canvas.winfo_exists():
+                self._clock_canvas.destroy()
+            self._clock_canvas = None
+            self._forget_canvas_items()
+        if self._time_label is not None:
+            if self._time_label.winfo_exists():
+                self._time_label.destroy()
+            self._time_label = None
 
     def _theme_bg(self) -> str:
         """Current theme background (for canvas and digital label)."""
@@ -524,8 +724,8 @@ class Clock(ttk.Frame):
             self._time_label = tk.Label(
                 self,
                 text="00:00:00",
-                font=(self._font_name, self._font_size, "bold"),
-                fg=self._clock_color,
+                font=(self._config.clock_font, self._config.clock_font_size, "bold"),
+                fg=self._config.clock_color,
                 bg=bg,
             )
             self._time_label.grid(row=1, column=0, sticky="nsew")
@@ -549,8 +749,9 @@ class Clock(ttk.Frame):
         Rotation: second 6°/sec, minute 6°/min + 0.1°/sec, hour 30°/hr + 0.5°/min.
         """
         radius, center_x, center_y = self._get_clock_dimensions()
-        if not HAS_PIL:
+        if not _load_pil():
             self._clock_canvas.delete("all")
+            self._forget_canvas_items()
             fill_color = (
                 self.parent.get_theme_colors()[1]
                 if hasattr(self.parent, "get_theme_colors")
@@ -564,31 +765,55 @@ class Clock(ttk.Frame):
         if "face" not in self._hand_images or self._hand_images["face"] is None:
             return
         # When only time changed, redraw only hands (keeps face, avoids flicker)
-        if not force_full and self._clock_canvas.find_withtag("face"):
+        if not force_full and "face" in self._canvas_items:
             self._draw_analog_hands_only(radius, center_x, center_y)
             return
-        self._clock_canvas.delete("all")
         new_refs: list[Any] = []
         face_img = self._hand_images["face"]
         face_scale = self._element_scale_override.get("face", 1.0)
         size = max(10, int(2 * radius * face_scale))
-        if not hasattr(self, "_face_cache"):
-            self._face_cache = {}
-        if size not in self._face_cache:
-            self._face_cache[size] = face_img.resize(
-                (size, size), Image.Resampling.LANCZOS
+        cached_face = self._face_photo
+        if cached_face is not None and cached_face[0] == size:
+            face_photo = cached_face[1]
+        else:
+            face_photo = ImageTk.PhotoImage(
+                face_img.resize((size, size), Image.Resampling.LANCZOS)
             )
-        face_photo = ImageTk.PhotoImage(self._face_cache[size])
+            self._face_photo = (size, face_photo)
         new_refs.append(face_photo)
         fx, fy = center_x, center_y
         if "face" in self._element_offsets:
             dx, dy = self._element_offsets["face"]
             fx, fy = center_x + dx, center_y + dy
-        self._clock_canvas.create_image(
-            fx, fy, image=face_photo, anchor=tk.CENTER, tags=("face",)
-        )
+        self._place_canvas_image("face", face_photo, fx, fy, tk.CENTER)
         self._draw_analog_hands_only(radius, center_x, center_y, new_refs)
         self._photo_refs[:] = new_refs
+        if self._analog_animation_enabled:
+            self._schedule_second_hand_warmup(radius)
+
+    def _place_canvas_image(
+        self, name: str, photo: Any, x: int, y: int, anchor: str
+    ) -> None:
+        """Show photo at (x, y) in the canvas item for name; created once, then updated."""
+        drawn = (photo, x, y)
+        if self._drawn_items.get(name) == drawn:
+            return
+        iid = self._canvas_items.get(name)
+        if iid is None:
+            tags = (name,) if name == "face" else ("hands", name)
+            self._canvas_items[name] = self._clock_canvas.create_image(
+                x, y, image=photo, anchor=anchor, tags=tags
+            )
+        else:
+            self._clock_canvas.coords(iid, x, y)
+            self._clock_canvas.itemconfigure(iid, image=photo)
+        self._drawn_items[name] = drawn
+
+    def _forget_canvas_items(self) -> None:
+        """Forget face/hand item ids after the canvas or its items are destroyed."""
+        self._canvas_items.clear()
+        self._drawn_items.clear()
+        self._last_hand_state = None
 
     def _draw_analog_hands_only(
         self,
@@ -597,26 +822,26 @@ class Clock(ttk.Frame):
         center_y: int,
         refs_list: list[Any] | None = None,
     ) -> None:
-        """Draw or redraw only the hour/minute/second hands (clear old hands first)."""
-        self._clock_canvas.delete("hands")
+        """Draw or redraw the hour/minute/second hands whose image or position changed."""
         refs_owned = refs_list is None
+        angles = self._hand_angles() if self._analog_animation_enabled else {}
+        rotations = self._element_rotation_override
+        offsets = self._element_offsets
+        state = (
+            radius, center_x, center_y, self._hand_cache_generation,
+            # Same half-degree steps _rotated_hand caches on
+            tuple(round((angles.get(n, 0) + rotations.get(n, 0)) * 2)
+                  for n in ("hour", "minute", "second")),
+            tuple(offsets.get(n) for n in ("hour", "minute", "second")),
+        )
+        if refs_owned and state == self._last_hand_state:
+            return
+        self._last_hand_state = state
         if refs_owned:
             refs_list = list(self._photo_refs[:1])
-        # Clock animation angles: 6° per second, 6° per min + 0.1° per sec, 30° per hr + 0.5° per min
-        if self._analog_animation_enabled:
-            now = datetime.now(self._tz) if self._tz else datetime.now()
-            sec = now.second + now.microsecond / 1_000_000
-            min_val = now.minute + sec / 60
-            hr = (now.hour % 12) + min_val / 60 if self._use_12_hour else (now.hour % 24) + min_val / 60
-            if self._use_12_hour:
-                hr = hr % 12
-            sec_angle = sec * 6
-            min_angle = min_val * 6
-            hr_angle = hr * 30 if self._use_12_hour else hr * 15
-        else:
-            sec_angle = min_angle = hr_angle = 0
-        for name, angle in [("hour", hr_angle), ("minute", min_angle), ("second", sec_angle)]:
-            rot_add = self._element_rotation_override.get(name, 0)
+        for name in ("hour", "minute", "second"):
+            angle = angles.get(name, 0)
+            rot_add = rotations.get(name, 0)
             result = self._rotated_hand(name, angle + rot_add, radius)
             if result is None:
                 continue
@@ -626,25 +851,29 @@ class Clock(ttk.Frame):
             if name in self._element_offsets:
                 dx, dy = self._element_offsets[name]
                 px, py = center_x + dx, center_y + dy
-            self._clock_canvas.create_image(
-                px - pivot_out_x, py - pivot_out_y,
-                image=photo, anchor=tk.NW, tags=("hands", name)
+            self._place_canvas_image(
+                name, photo, px - pivot_out_x, py - pivot_out_y, tk.NW
             )
         if refs_owned:
             self._photo_refs[:] = refs_list
 
     def _update_time(self) -> None:
         """Update displayed time (called every second)."""
-        now = datetime.now(self._tz) if self._tz else datetime.now()
         if self._use_digital:
-            if self._use_12_hour:
+            cfg = self._config
+            now = datetime.now(cfg.timezone) if cfg.timezone else datetime.now()
+            sep = cfg.time_separator
+            if cfg.use_12_hour:
                 h = now.hour % 12 or 12
                 ampm = " AM" if now.hour < 12 else " PM"
-                time_str = f"{h:02d}{self._time_sep}{now.minute:02d}{self._time_sep}{now.second:02d}{ampm}"
+                time_str = f"{h:02d}{sep}{now.minute:02d}{sep}{now.second:02d}{ampm}"
             else:
-                time_str = f"{now.hour:02d}{self._time_sep}{now.minute:02d}{self._time_sep}{now.second:02d}"
+                time_str = f"{now.hour:02d}{sep}{now.minute:02d}{sep}{now.second:02d}"
             self._time_label.config(text=time_str)
-        else:
-            if self._analog_animation_enabled:
+        elif self._analog_animation_enabled:
+            second = int(self._local_seconds()) % 60
+            if second != self._last_drawn_sec:
+                self._last_drawn_sec = second
                 self._draw_analog_clock(force_full=False)
-        self.after(1000, self._update_time)
+        # Wake just after the next second boundary instead of drifting by 1000 ms
+        self.after(1000 - int(time.time() * 1000) % 1000, self._update_time)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import re
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 from typing import TYPE_CHECKING, Any
 
@@ -56,10 +57,113 @@ ELEMENT_ALIASES: dict[str, str] = {
 }
 
 
+# Most recent commands kept for Up/Down recall
+_HISTORY_LIMIT = 200
+
+# Lines of output kept in the console scrollback
+_OUTPUT_LINE_LIMIT = 500
+
+# All console clock.* commands in one pattern, matched against the lowercased command.
+# Branches are tried in the order the commands were historically matched;
+# m.lastgroup names the command (its value group).
+_RE_COMMAND = re.compile(
+    r"clock\.(?:"
+    r"(?P<dd_elem>[^.]+)\.drag\s*&\s*drop\s*=\s*(?P<drag_drop>true|false)"
+    r"|analog_animation\s*=\s*(?P<animation>true|false)"
+    r"|(?P<elem>[^.]+)\.(?:"
+    r"resize\s*=\s*(?P<resize>true|false)"
+    r"|scale\s*=\s*(?P<scale>[\d.]+)"
+    r"|rotate\s*=\s*(?P<rotate>[\d.-]+)"
+    r"|pivot\s*=\s*(?P<pivot>center|bottom|[\d.]+\s*,\s*[\d.]+)"
+    r"))"
+)
+
+
+# ELEMENT_ALIASES plus common spellings (upper/title case, spaces) so typical input needs no rewriting
+_ELEMENT_LOOKUP: dict[str, str] = {}
+for _alias, _elem in ELEMENT_ALIASES.items():
+    for _variant in (_alias, _alias.upper(), _alias.title(), _alias.replace("_", " ")):
+        _ELEMENT_LOOKUP[_variant] = _elem
+del _alias, _elem, _variant
+
+
 def _normalize_element(name: str) -> str | None:
     """Map user input to internal element key."""
-    key = name.strip().lower().replace(" ", "_")
-    return ELEMENT_ALIASES.get(key)
+    return _ELEMENT_LOOKUP.get(name) or ELEMENT_ALIASES.get(
+        name.strip().lower().replace(" ", "_"))
+
+
+def _cmd_drag_drop(clock: Any, elem: str, _raw_elem: str, value: str) -> str:
+    """clock.{element}.drag&drop = true|false"""
+    val = value.lower() == "true"
+    clock.set_drag_drop(elem, val)
+    return f"clock.{elem}.drag&drop = {val}"
+
+
+def _cmd_animation(clock: Any, _elem: None, _raw_elem: None, value: str) -> str:
+    """clock.analog_animation = true|false"""
+    val = value.lower() == "true"
+    clock.set_analog_animation(val)
+    return f"clock.analog_animation = {val}"
+
+
+def _cmd_resize(clock: Any, elem: str, _raw_elem: str, value: str) -> str:
+    """clock.{element}.resize = true|false (toggle resize mode with =/+ and -/_)"""
+    val = value.lower() == "true"
+    clock.set_resize_mode(elem, val)
+    return f"clock.{elem}.resize = {val} (use =/+ to increase, -/_ to decrease)"
+
+
+def _cmd_scale(clock: Any, elem: str, _raw_elem: str, value: str) -> str:
+    """clock.{element}.scale = value"""
+    try:
+        val = float(value)
+    except ValueError:
+        return t("console.invalid_scale")
+    clock.set_element_scale(elem, val)
+    return f"clock.{elem}.scale = {val}"
+
+
+def _cmd_rotate(clock: Any, elem: str, _raw_elem: str, value: str) -> str:
+    """clock.{element}.rotate = degrees"""
+    try:
+        val = float(value)
+    except ValueError:
+        return t("console.invalid_rotation")
+    clock.set_element_rotation(elem, val)
+    return f"clock.{elem}.rotate = {val}°"
+
+
+def _cmd_pivot(clock: Any, elem: str, raw_elem: str, value: str) -> str:
+    """clock.{element}.pivot = center|bottom|x,y"""
+    p = value.strip().lower()
+    if p == "center":
+        clock.set_hand_pivot(elem, "center")
+        return f"clock.{elem}.pivot = center"
+    if p == "bottom":
+        clock.set_hand_pivot(elem, "bottom")
+        return f"clock.{elem}.pivot = bottom"
+    parts = [x.strip() for x in p.split(",")]
+    if len(parts) == 2:
+        try:
+            xr, yr = float(parts[0]), float(parts[1])
+        except ValueError:
+            pass
+        else:
+            clock.set_hand_pivot(elem, (xr, yr))
+            return f"clock.{elem}.pivot = ({xr}, {yr})"
+    return t("console.invalid_pivot", raw_elem)
+
+
+# Regex group name -> handler(clock, element, raw element, value)
+_COMMAND_HANDLERS = {
+    "drag_drop": _cmd_drag_drop,
+    "animation": _cmd_animation,
+    "resize": _cmd_resize,
+    "scale": _cmd_scale,
+    "rotate": _cmd_rotate,
+    "pivot": _cmd_pivot,
+}
 
 
 class Console(ttk.Frame):
@@ -68,8 +172,14 @@ class Console(ttk.Frame):
     def __init__(self, parent: "ClockApp", *args: Any, **kwargs: Any) -> None:
         super().__init__(parent, *args, **kwargs)
         self.parent = parent
+        # Translated list_commands text; cleared on language change
+        self._cached_cmdlist: str | None = None
         self._build_ui()
 
+    def refresh_translations(self) -> None:
+        """Drop cached translated text after a language change."""
+        self._cached_cmdlist = None
+
     def _theme_colors(self) -> tuple[str, str]:
         """Current theme (bg, fg). Uses parent.get_theme_colors() if available."""
         if hasattr(self.parent, "get_theme_colors"):
@@ -80,6 +190,7 @@ class Console(ttk.Frame):
         """Build console input area."""
         self.grid_columnconfigure(0, weight=1)
         bg, fg = self._theme_colors()
+        self._applied_theme: tuple[str, str] = (bg, fg)
         self._output = tk.Text(
             self, height=4, wrap=tk.WORD, state=tk.DISABLED,
             font=("Consolas", 9), bg=bg, fg=fg,
@@ -88,7 +199,7 @@ class Console(ttk.Frame):
         self._output.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         self.entry = ttk.Entry(self, font=("Consolas", 10))
         self.entry.grid(row=1, column=0, sticky="ew", padx=5, pady=(0, 5))
-        self._history: list[str] = []
+        self._history: deque[str] = deque(maxlen=_HISTORY_LIMIT)
         self._history_index = -1
         self.entry.bind("<Return>", self._on_enter)
         self.entry.bind("<Escape>", self._on_escape)
@@ -97,7 +208,11 @@ class Console(ttk.Frame):
 
     def refresh_theme_colors(self) -> None:
         """Apply current app theme colors (bg/fg only)."""
-        bg, fg = self._theme_colors()
+        colors = self._theme_colors()
+        if colors == self._applied_theme:
+            return
+        self._applied_theme = colors
+        bg, fg = colors
         self._output.configure(bg=bg, fg=fg, insertbackground=fg)
 
     def _on_escape(self, _event: tk.Event) -> None:
@@ -107,9 +222,7 @@ class Console(ttk.Frame):
             self.parent.grid_rowconfigure(1, weight=0)
             self.set_collapsed(True)
         else:
-            self.parent._console_visible = False
-            self.parent._console_expanded = False
-            self.parent.console.grid_forget()
+            self.parent.hide_console()
 
     def set_collapsed(self, collapsed: bool) -> None:
         """Show collapsed (entry only) or expanded (output + entry)."""
@@ -120,34 +233,40 @@ class Console(ttk.Frame):
             self._output.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
             self.grid_rowconfigure(0, weight=1)
 
-    def _log(self, msg: str) -> None:
-        """Append to console output."""
-        self._output.config(state=tk.NORMAL)
-        self._output.insert(tk.END, msg + "\n")
-        self._output.see(tk.END)
-        self._output.config(state=tk.DISABLED)
+    def _log(self, *msgs: str) -> None:
+        """Append one or more lines to console output with a single state toggle."""
+        msg = "\n".join(msgs)
+        out = self._output
+        out.config(state=tk.NORMAL)
+        out.insert(tk.END, msg if msg.endswith("\n") else msg + "\n")
+        # Keep the scrollback bounded; "end-1c" sits on the empty line after the last newline
+        excess = int(out.index("end-1c").split(".")[0]) - 1 - _OUTPUT_LINE_LIMIT
+        if excess > 0:
+            out.delete("1.0", f"{excess + 1}.0")
+        out.see(tk.END)
+        out.config(state=tk.DISABLED)
 
     def _on_history_up(self, event: tk.Event) -> None:
         """Cycle to previous command in history."""
-        if not self._history:
-            return
-        if self._history_index < len(self._history) - 1:
-            self._history_index += 1
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, self._history[-(1 + self._history_index)])
-        return "break"
+        return self._move_history(1)
 
     def _on_history_down(self, event: tk.Event) -> None:
         """Cycle to next command in history."""
+        return self._move_history(-1)
+
+    def _move_history(self, delta: int) -> str | None:
+        """Step through history (+1 older, -1 newer); stepping past the newest clears the entry."""
         if not self._history:
-            return
-        if self._history_index > 0:
-            self._history_index -= 1
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, self._history[-(1 + self._history_index)])
-        else:
+            return None
+        index = self._history_index + delta
+        if index >= len(self._history):
+            return "break"
+        self.entry.delete(0, tk.END)
+        if index < 0:
             self._history_index = -1
-            self.entry.delete(0, tk.END)
+        else:
+            self._history_index = index
+            self.entry.insert(0, self._history[-(1 + index)])
         return "break"
 
     def _on_enter(self, event: tk.Event) -> None:
@@ -163,105 +282,41 @@ class Console(ttk.Frame):
         if not cmd:
             return
         self._history.append(cmd)
-        self._log(f"> {cmd}")
         result = self._execute(cmd)
-        if result is not None:
-            self._log(str(result))
+        if result is None:
+            self._log(f"> {cmd}")
+        else:
+            self._log(f"> {cmd}", str(result))
 
     def _execute(self, cmd: str) -> str | None:
         """Parse and execute command. Returns message or None."""
         cmd = cmd.strip()
-        if cmd.lower() == "list_commands":
-            return t("console.commands_list")
-        # clock.{element}.drag&drop = true|false
-        m = re.match(
-            r"clock\.([^.]+)\.drag\s*&\s*drop\s*=\s*(true|false)",
-            cmd, re.IGNORECASE
-        )
-        if m:
-            elem = _normalize_element(m.group(1))
-            if elem and self.parent.clock:
-                val = m.group(2).lower() == "true"
-                self.parent.clock.set_drag_drop(elem, val)
-                return f"clock.{elem}.drag&drop = {val}"
-            return t("console.unknown_element", m.group(1))
-
-        # clock.analog_animation = true|false
-        m = re.match(r"clock\.analog_animation\s*=\s*(true|false)",
-                     cmd, re.IGNORECASE)
-        if m:
-            if self.parent.clock:
-                val = m.group(1).lower() == "true"
-                self.parent.clock.set_analog_animation(val)
-                return f"clock.analog_animation = {val}"
+        low = cmd.lower()
+        if low == "list_commands":
+            text = self._cached_cmdlist
+            if text is None:
+                text = self._cached_cmdlist = t("console.commands_list")
+            return text
+        if not low.startswith("clock."):
+            return t("console.unknown_command", cmd)
+        m = _RE_COMMAND.match(low)
+        if m is None:
+            return t("console.unknown_command", cmd)
+        name = m.lastgroup
+        elem_group = "dd_elem" if name == "drag_drop" else "elem"
+        # Messages echo the element as typed; spans line up unless lower() changed the length
+        src = cmd if len(cmd) == len(low) else low
+        start, end = m.span(elem_group)
+        raw_elem = src[start:end] if start >= 0 else None
+        elem = None
+        if raw_elem is not None:
+            elem = _normalize_element(raw_elem)
+            if elem is None:
+                if name == "pivot":
+                    return t("console.invalid_pivot", raw_elem)
+                return t("console.unknown_element", raw_elem)
+        # Only an already-built clock; the parent.clock property would build a hidden one
+        clock = self.parent._clock
+        if clock is None:
             return t("console.clock_not_ready")
-
-        # clock.{element}.resize = true|false (toggle resize mode with =/+ and -/_)
-        m = re.match(
-            r"clock\.([^.]+)\.resize\s*=\s*(true|false)",
-            cmd, re.IGNORECASE
-        )
-        if m:
-            elem = _normalize_element(m.group(1))
-            if elem and self.parent.clock:
-                val = m.group(2).lower() == "true"
-                self.parent.clock.set_resize_mode(elem, val)
-                return f"clock.{elem}.resize = {val} (use =/+ to increase, -/_ to decrease)"
-            return t("console.unknown_element", m.group(1))
-
-        # clock.{element}.scale = value
-        m = re.match(
-            r"clock\.([^.]+)\.scale\s*=\s*([\d.]+)",
-            cmd, re.IGNORECASE
-        )
-        if m:
-            elem = _normalize_element(m.group(1))
-            if elem and self.parent.clock:
-                try:
-                    val = float(m.group(2))
-                    self.parent.clock.set_element_scale(elem, val)
-                    return f"clock.{elem}.scale = {val}"
-                except ValueError:
-                    return t("console.invalid_scale")
-            return t("console.unknown_element", m.group(1))
-
-        # clock.{element}.rotate = degrees
-        m = re.match(
-            r"clock\.([^.]+)\.rotate\s*=\s*([\d.-]+)", cmd, re.IGNORECASE)
-        if m:
-            elem = _normalize_element(m.group(1))
-            if elem and self.parent.clock:
-                try:
-                    val = float(m.group(2))
-                    self.parent.clock.set_element_rotation(elem, val)
-                    return f"clock.{elem}.rotate = {val}°"
-                except ValueError:
-                    return t("console.invalid_rotation")
-            return t("console.unknown_element", m.group(1))
-
-        # clock.{element}.pivot = center|bottom|x,y
-        m = re.match(
-            r"clock\.([^.]+)\.pivot\s*=\s*(center|bottom|[\d.]+\s*,\s*[\d.]+)",
-            cmd, re.IGNORECASE
-        )
-        if m:
-            elem = _normalize_element(m.group(1))
-            if elem and self.parent.clock:
-                p = m.group(2).strip().lower()
-                if p == "center":
-                    self.parent.clock.set_hand_pivot(elem, "center")
-                    return f"clock.{elem}.pivot = center"
-                if p == "bottom":
-                    self.parent.clock.set_hand_pivot(elem, "bottom")
-                    return f"clock.{elem}.pivot = bottom"
-                parts = [x.strip() for x in p.split(",")]
-                if len(parts) == 2:
-                    try:
-                        xr, yr = float(parts[0]), float(parts[1])
-                        self.parent.clock.set_hand_pivot(elem, (xr, yr))
-                        return f"clock.{elem}.pivot = ({xr}, {yr})"
-                    except ValueError:
-                        pass
-            return t("console.invalid_pivot", m.group(1))
-
-        return t("console.unknown_command", cmd)
+        return _COMMAND_HANDLERS[name](clock, elem, raw_elem, m.group(name))
@@ -29,6 +29,7 @@ class Loading(ttk.Frame):
         self._progress_pct: float = 0.0
         self._target_pct: float = 0.0
         self._animate_job: str | None = None
+        self._last_fill_px: int = 0
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
         self._build_ui()
@@ -54,9 +55,10 @@ class Loading(ttk.Frame):
         self._inner.grid_rowconfigure(2, weight=1)
         self._inner.grid_columnconfigure(0, weight=1)
 
+        self._label_text = t("loading.text")
         self._loading_label = tk.Label(
             self._inner,
-            text=t("loading.text"),
+            text=self._label_text,
             font=("", 14),
             fg=fg,
             bg=bg,
@@ -91,11 +93,17 @@ class Loading(ttk.Frame):
 
     def refresh_translations(self) -> None:
         """Update labels with current language."""
-        self._loading_label.config(text=t("loading.text"))
+        self._set_label_text(t("loading.text"))
 
     def set_message(self, text: str) -> None:
         """Set the loading label text (e.g. for 'Translating...')."""
-        self._loading_label.config(text=text)
+        self._set_label_text(text)
+
+    def _set_label_text(self, text: str) -> None:
+        """Configure the loading label only when its text actually changes."""
+        if text != self._label_text:
+            self._loading_label.config(text=text)
+            self._label_text = text
 
     def set_progress(self, target_pct: float) -> None:
         """
@@ -119,12 +127,21 @@ class Loading(ttk.Frame):
         else:
             self._progress_pct = self._target_pct
 
-        fill_width = self.BAR_WIDTH * self._progress_pct / 100
-        self._progress_canvas.coords(
-            self._progress_fill,
-            0, 0, fill_width, self.BAR_HEIGHT
-        )
-        self.update_idletasks()
+        # Only touch the canvas when the bar moves by a whole pixel; Tk repaints on idle
+        fill_width = int(self.BAR_WIDTH * self._progress_pct / 100)
+        if fill_width != self._last_fill_px:
+            self._progress_canvas.coords(
+                self._progress_fill,
+                0, 0, fill_width, self.BAR_HEIGHT
+            )
+            self._last_fill_px = fill_width
 
-        if self._progress_pct < self._target_pct:
+        # A hidden loading screen does not keep ticking; the next set_progress restarts it
+        if self._progress_pct < self._target_pct and self.winfo_ismapped():
             self._animate_job = self.after(20, self._animate_progress)
+
+    def stop_animation(self) -> None:
+        """Cancel any pending progress animation step."""
+        if self._animate_job:
+            self.after_cancel(self._animate_job)
+            self._animate_job = None
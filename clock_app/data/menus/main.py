@@ -15,6 +15,16 @@ if TYPE_CHECKING:
     from ...imports import ClockApp
 
 
+# Widget attribute -> (translation key, default) for the translated button/label texts
+_TEXT_KEYS: tuple[tuple[str, str, str | None], ...] = (
+    ("label", "main_menu.label", None),
+    ("clock_button", "main_menu.clock", None),
+    ("options_button", "main_menu.options", None),
+    ("update_button", "main_menu.check_for_updates", "Check for Updates"),
+    ("exit_button", "main_menu.exit", None),
+)
+
+
 class MainMenu(ttk.Frame):
     """
     Main Menu for Clock App.
@@ -26,36 +36,38 @@ class MainMenu(ttk.Frame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_rowconfigure(6, weight=1)
         self.grid_columnconfigure(0, weight=1)
-        self.label = ttk.Label(self, text=t("main_menu.label"))
+        # Texts currently shown, seeded here so refresh_translations skips identical config() calls
+        texts: dict[str, str] = {attr: t(key, default) for attr, key, default in _TEXT_KEYS}
+        self._shown_texts = texts
+        self.label = ttk.Label(self, text=texts["label"])
         self.label.grid(row=1, column=0, pady=10)
         self.clock_button = ttk.Button(
-            self, text=t("main_menu.clock"), command=self.open_clock)
+            self, text=texts["clock_button"], command=self.open_clock)
         self.clock_button.grid(row=2, column=0, pady=5)
         self.options_button = ttk.Button(
-            self, text=t("main_menu.options"), command=self.open_options)
+            self, text=texts["options_button"], command=self.open_options)
         self.options_button.grid(row=3, column=0, pady=5)
         self.update_button = ttk.Button(
             self,
-            text=t("main_menu.check_for_updates", "Check for Updates"),
+            text=texts["update_button"],
             command=self.check_for_updates,
         )
         self.update_button.grid(row=4, column=0, pady=5)
         self.exit_button = ttk.Button(
-            self, text=t("main_menu.exit"), command=self.parent.quit)
+            self, text=texts["exit_button"], command=self.parent.quit)
         self.exit_button.grid(row=5, column=0, pady=5)
 
     def refresh_theme_colors(self) -> None:
         """Apply current app theme (MainMenu uses ttk, so colors come from style)."""
 
     def refresh_translations(self) -> None:
-        """Update labels and buttons with current language."""
-        self.label.config(text=t("main_menu.label"))
-        self.clock_button.config(text=t("main_menu.clock"))
-        self.options_button.config(text=t("main_menu.options"))
-        self.update_button.config(
-            text=t("main_menu.check_for_updates", "Check for Updates")
-        )
-        self.exit_button.config(text=t("main_menu.exit"))
+        """Update labels and buttons with current language (skips unchanged texts)."""
+        shown = self._shown_texts
+        for attr, key, default in _TEXT_KEYS:
+            text = t(key, default)
+            if shown.get(attr) != text:
+                getattr(self, attr).config(text=text)
+                shown[attr] = text
 
     def check_for_updates(self) -> None:
         """Trigger manual update check."""
@@ -1,4 +1,4 @@
-# pylint: disable=line-too-long,unused-import,import-outside-toplevel
+# pylint: disable=line-too-long,unused-import,unused-argument,import-outside-toplevel
 # type: ignore[union-attr]
 """
 Options module for the clock app.
@@ -31,6 +31,17 @@ _DISABLED_OPTIONS: frozenset[str] = frozenset({
     "app_animation_option", "app_clock_type",
 })
 
+# Options whose change must re-arm the app's auto-update timer
+_UPDATE_OPTION_KEYS: frozenset[str] = frozenset({
+    "D.app_update_option", "D.app_update_source", "D.app_update_check_frequency",
+})
+
+# Option edits within this window are written to clock_app.ini together
+_INI_WRITE_DELAY_MS = 250
+
+# Bindtag carrying the mouse wheel bindings for every widget inside the scroll frame
+_SCROLL_BINDTAG = "OptionsScroll"
+
 _SECTION_TO_KEY: dict[str, str] = {
     "-C- App Info": "ini.section.app_info",
     "-C- App Settings": "ini.section.app_settings",
@@ -42,8 +53,8 @@ _SECTION_TO_KEY: dict[str, str] = {
 }
 
 
-def _get_supported_list(config: configparser.ConfigParser, section: str, option: str) -> list[str]:
-    """Find C.supported_* option for a D.* option to get dropdown choices."""
+def _supported_option_name(option: str) -> str:
+    """Name of the C.supported_* option holding the dropdown choices for D.{option}."""
     stem = option.replace("app_", "")
     if stem.endswith("_type"):
         expected_suffix = stem.replace("_type", "_types")
@@ -53,13 +64,12 @@ def _get_supported_list(config: configparser.ConfigParser, section: str, option:
         expected_suffix = stem.replace("_frequency", "_frequencies")
     else:
         expected_suffix = stem + "s"
-    target = f"supported_{expected_suffix}"
-    for key in config.options(section):
-        parsed = _parse_option_key(key)
-        if parsed and parsed[0] == "C" and parsed[1] == target:
-            val = config.get(section, key)
-            return [x.strip() for x in val.split(",")]
-    return []
+    return f"supported_{expected_suffix}"
+
+
+def _get_supported_list(supported: dict[str, list[str]], option: str) -> list[str]:
+    """Find C.supported_* choices for a D.* option in a section's supported map."""
+    return supported.get(_supported_option_name(option), [])
 
 
 class Options(ttk.Frame):
@@ -76,15 +86,40 @@ class Options(ttk.Frame):
         self.config = configparser.ConfigParser()
         # Preserve option name case (C.app_name not c.app_name)
         self.config.optionxform = str
-        if not os.path.exists(CLOCK_APP_INI_PATH):
+        if not getattr(parent, "_ini_exists", False) and not os.path.isfile(CLOCK_APP_INI_PATH):
             create_clock_app_ini()
 
         self.config.read(CLOCK_APP_INI_PATH, encoding="utf-8")
         self._ini_path = CLOCK_APP_INI_PATH
+        self._flush_job: str | None = None
+        # Parsed once here (and per section on save) so UI rebuilds skip ConfigParser
+        self._sections_parsed: dict[str, list[tuple[str, str, str]]] = {}
+        self._supported_map: dict[str, dict[str, list[str]]] = {}
+        for section in self.config.sections():
+            self._index_section(section)
         self._widget_vars: dict[str, tk.Variable] = {}
+        # Entry/Spinbox -> (section, full_key, variable), read by the shared FocusOut handler
+        self._widget_meta: dict[tk.Widget, tuple[str, str, tk.Variable]] = {}
         self._theme_comment_labels: list[tk.Label] = []
         self._build_ui()
 
+    def _index_section(self, section: str) -> None:
+        """Cache section's shown (widget_var, option_name, value) rows and C.supported_* choices."""
+        rows: list[tuple[str, str, str]] = []
+        supported: dict[str, list[str]] = {}
+        for key in self.config.options(section):
+            parsed = _parse_option_key(key)
+            if not parsed:
+                continue
+            wv, opt_name = parsed
+            value = self.config.get(section, key)
+            if wv == "C" and opt_name.startswith("supported_") and opt_name not in supported:
+                supported[opt_name] = [x.strip() for x in value.split(",")]
+            if opt_name not in _DISABLED_OPTIONS:
+                rows.append((wv, opt_name, value))
+        self._sections_parsed[section] = rows
+        self._supported_map[section] = supported
+
     def _build_ui(self) -> None:
         """Build the options UI from loaded config."""
         self.grid_rowconfigure(1, weight=1)
@@ -111,6 +146,13 @@ class Options(ttk.Frame):
         self._scroll_canvas.grid(row=1, column=0, sticky="nsew")
         scrollbar.grid(row=1, column=1, sticky="ns")
 
+        # Wheel handlers live on one bindtag; rebuilt widgets only need the tag
+        self.bind_class(_SCROLL_BINDTAG, "<MouseWheel>", self._on_mousewheel)
+        self.bind_class(
+            _SCROLL_BINDTAG, "<Button-4>", lambda e: self._on_mousewheel_linux(e, -3))
+        self.bind_class(
+            _SCROLL_BINDTAG, "<Button-5>", lambda e: self._on_mousewheel_linux(e, 3))
+
         self._populate_options()
         self._scroll_canvas.bind("<MouseWheel>", self._on_mousewheel)
         self._scroll_canvas.bind(
@@ -121,10 +163,20 @@ class Options(ttk.Frame):
 
         self.back_button = ttk.Button(
             self, text=t("common.back"),
-            command=lambda: self.parent.switch_menu("main")
+            command=self._on_back
         )
         self.back_button.grid(row=2, column=0, pady=10)
 
+    def _on_back(self) -> None:
+        """Write any pending option edits, then return to the main menu."""
+        self._flush_ini()
+        self.parent.switch_menu("main")
+
+    def destroy(self) -> None:
+        """Write any pending option edits before the widget goes away."""
+        self._flush_ini()
+        super().destroy()
+
     def _on_mousewheel(self, event: tk.Event) -> None:
         """Scroll the options canvas with mouse wheel (Windows/macOS)."""
         self._scroll_canvas.yview_scroll(
@@ -137,11 +189,11 @@ class Options(ttk.Frame):
         self._scroll_canvas.yview_scroll(direction, "units")
 
     def _bind_mousewheel(self, widget: tk.Widget | None = None) -> None:
-        """Bind mouse wheel to widget and all descendants for scrolling."""
+        """Prepend the scroll bindtag to widget and all descendants (bindtags are not inherited)."""
         w = widget if widget is not None else self.scroll_frame
-        w.bind("<MouseWheel>", self._on_mousewheel)
-        w.bind("<Button-4>", lambda e: self._on_mousewheel_linux(e, -3))
-        w.bind("<Button-5>", lambda e: self._on_mousewheel_linux(e, 3))
+        tags = w.bindtags()
+        if _SCROLL_BINDTAG not in tags:
+            w.bindtags((_SCROLL_BINDTAG,) + tags)
         for child in w.winfo_children():
             self._bind_mousewheel(child)
 
@@ -152,6 +204,7 @@ class Options(ttk.Frame):
         for child in self.scroll_frame.winfo_children():
             child.destroy()
         self._widget_vars.clear()
+        self._widget_meta.clear()
         self._populate_options()
         self._bind_mousewheel()
 
@@ -165,21 +218,15 @@ class Options(ttk.Frame):
             "-S- Notifications", "-S- Updates"
         ]
         for section in section_order:
-            if not self.config.has_section(section):
+            rows = self._sections_parsed.get(section)
+            if rows is None:
                 continue
             sect_text = t(_SECTION_TO_KEY.get(section, section), section)
             sect_frame = ttk.LabelFrame(self.scroll_frame, text=sect_text)
             sect_frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
             sect_frame.grid_columnconfigure(1, weight=1)
             srow = 0
-            for key in self.config.options(section):
-                parsed = _parse_option_key(key)
-                if not parsed:
-                    continue
-                wv, opt_name = parsed
-                if opt_name in _DISABLED_OPTIONS:
-                    continue
-                value = self.config.get(section, key)
+            for wv, opt_name, value in rows:
                 widget_row = self._add_option_widget(
                     sect_frame, srow, wv, opt_name, value, section)
                 if widget_row is not None:
@@ -196,131 +243,185 @@ class Options(ttk.Frame):
         section: str,
     ) -> int | None:
         """Add a widget for the option; returns next row or None if skipped."""
-        var_key = f"{section}::{opt_name}"
-        if widget_var == "C":
-            comment_text = t(f"ini.comment.{opt_name}", value)
-            comment_fg = (
-                self.parent.get_theme_comment_fg()
-                if hasattr(self.parent, "get_theme_comment_fg")
-                else "gray"
-            )
-            bg = (
-                self.parent.get_theme_colors()[0]
-                if hasattr(self.parent, "get_theme_colors")
-                else "SystemButtonFace"
-            )
-            lbl = tk.Label(
-                parent, text=comment_text, fg=comment_fg, bg=bg,
-            )
-            lbl.grid(row=row, column=0, columnspan=2,
-                     sticky="w", padx=5, pady=2)
-            if hasattr(self, "_theme_comment_labels"):
-                self._theme_comment_labels.append(lbl)
-            return row + 1
+        builder = self._WIDGET_BUILDERS.get(widget_var)
+        if builder is None:
+            return None
+        return builder(self, parent, row, opt_name, value, section)
+
+    def _add_option_label(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str
+    ) -> None:
+        """Add the translated option name in column 0."""
         opt_label = t(f"ini.opt.{opt_name}",
                       opt_name.replace("_", " ").title())
-        if widget_var == "L":
-            ttk.Label(parent, text=opt_label).grid(
-                row=row, column=0, sticky="w", padx=5, pady=2
-            )
-            ttk.Label(parent, text=value).grid(
-                row=row, column=1, sticky="w", padx=5, pady=2)
-            return row + 1
-        if widget_var == "T":
-            ttk.Label(parent, text=opt_label).grid(
-                row=row, column=0, sticky="w", padx=5, pady=2
-            )
-            v = tk.BooleanVar(value=value.strip().lower()
-                              in ("true", "1", "yes"))
-            self._widget_vars[var_key] = v
-            full_key = f"{widget_var}.{opt_name}"
-            cb = ttk.Checkbutton(
-                parent, variable=v,
-                command=lambda s=section, k=full_key: self._save_option(
-                    s, k, "True" if v.get() else "False")
-            )
-            cb.grid(row=row, column=1, sticky="w", padx=5, pady=2)
-            return row + 1
-        if widget_var == "D":
-            ttk.Label(parent, text=opt_label).grid(
-                row=row, column=0, sticky="w", padx=5, pady=2
-            )
-            choices_raw = [c.strip() for c in _get_supported_list(
-                self.config, section, opt_name)]
-            if not choices_raw:
-                choices_raw = [value.strip()]
-            choices_display = [t(f"ini.val.{c}", c) for c in choices_raw]
-            current_display = t(
-                f"ini.val.{value.strip()}", value.strip()) if value.strip() else value
-            v = tk.StringVar(value=current_display)
-            self._widget_vars[var_key] = v
-            self._widget_vars[f"{var_key}::raw"] = choices_raw
-            cb = ttk.Combobox(
-                parent, textvariable=v, values=choices_display, state="readonly", width=30
-            )
-            cb.grid(row=row, column=1, sticky="w", padx=5, pady=2)
-            full_key = f"{widget_var}.{opt_name}"
-
-            def _on_dropdown_select(
-                _e: tk.Event, s: str, k: str, vr: tk.StringVar, oname: str
-            ) -> None:
-                sel = vr.get()
-                raw_choices = self._widget_vars.get(
-                    f"{s}::{oname}::raw", [sel])
-                raw_val = sel
-                for rc in raw_choices:
-                    if t(f"ini.val.{rc}", rc) == sel:
-                        raw_val = rc
-                        break
-                self._save_option(s, k, raw_val)
-
-            cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, s=section, k=full_key: _on_dropdown_select(
-                    e, s, k, v, opt_name),
-            )
-            return row + 1
-        if widget_var == "E":
-            ttk.Label(parent, text=opt_label).grid(
-                row=row, column=0, sticky="w", padx=5, pady=2
-            )
-            v = tk.StringVar(value=value)
-            self._widget_vars[var_key] = v
-            e = ttk.Entry(parent, textvariable=v, width=40)
-            e.grid(row=row, column=1, sticky="ew", padx=5, pady=2)
-            full_key = f"{widget_var}.{opt_name}"
-            e.bind("<FocusOut>", lambda e, s=section,
-                   k=full_key: self._save_option(s, k, v.get()))
-            return row + 1
-        if widget_var == "N":
-            ttk.Label(parent, text=opt_label).grid(
-                row=row, column=0, sticky="w", padx=5, pady=2
-            )
-            try:
-                num_val = int(float(value))
-            except (ValueError, TypeError):
-                num_val = 0
-            v = tk.StringVar(value=str(num_val))
-            self._widget_vars[var_key] = v
-            sp = ttk.Spinbox(parent, from_=0, to=999, textvariable=v, width=10)
-            sp.grid(row=row, column=1, sticky="w", padx=5, pady=2)
-            full_key = f"{widget_var}.{opt_name}"
-            sp.bind("<FocusOut>", lambda e, s=section,
-                    k=full_key: self._save_option(s, k, v.get()))
-            return row + 1
-        return None
+        ttk.Label(parent, text=opt_label).grid(
+            row=row, column=0, sticky="w", padx=5, pady=2
+        )
+
+    def _build_comment_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """C: translated comment label spanning both columns."""
+        comment_text = t(f"ini.comment.{opt_name}", value)
+        comment_fg = (
+            self.parent.get_theme_comment_fg()
+            if hasattr(self.parent, "get_theme_comment_fg")
+            else "gray"
+        )
+        bg = (
+            self.parent.get_theme_colors()[0]
+            if hasattr(self.parent, "get_theme_colors")
+            else "SystemButtonFace"
+        )
+        lbl = tk.Label(
+            parent, text=comment_text, fg=comment_fg, bg=bg,
+        )
+        lbl.grid(row=row, column=0, columnspan=2,
+                 sticky="w", padx=5, pady=2)
+        if hasattr(self, "_theme_comment_labels"):
+            self._theme_comment_labels.append(lbl)
+        return row + 1
+
+    def _build_label_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """L: read-only value label."""
+        self._add_option_label(parent, row, opt_name)
+        ttk.Label(parent, text=value).grid(
+            row=row, column=1, sticky="w", padx=5, pady=2)
+        return row + 1
+
+    def _build_toggle_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """T: checkbutton saving True/False."""
+        self._add_option_label(parent, row, opt_name)
+        v = tk.BooleanVar(value=value.strip().lower()
+                          in ("true", "1", "yes"))
+        self._widget_vars[f"{section}::{opt_name}"] = v
+        full_key = f"T.{opt_name}"
+        cb = ttk.Checkbutton(
+            parent, variable=v,
+            command=lambda s=section, k=full_key: self._save_option(
+                s, k, "True" if v.get() else "False")
+        )
+        cb.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        return row + 1
+
+    def _build_dropdown_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """D: readonly combobox over the matching C.supported_* choices."""
+        self._add_option_label(parent, row, opt_name)
+        var_key = f"{section}::{opt_name}"
+        choices_raw = [c.strip() for c in _get_supported_list(
+            self._supported_map.get(section, {}), opt_name)]
+        if not choices_raw:
+            choices_raw = [value.strip()]
+        choices_display = [t(f"ini.val.{c}", c) for c in choices_raw]
+        # Reverse map for the selection handler; the first raw choice wins on equal display text
+        display_to_raw: dict[str, str] = {}
+        for disp, raw in zip(choices_display, choices_raw):
+            display_to_raw.setdefault(disp, raw)
+        current_display = t(
+            f"ini.val.{value.strip()}", value.strip()) if value.strip() else value
+        v = tk.StringVar(value=current_display)
+        self._widget_vars[var_key] = v
+        cb = ttk.Combobox(
+            parent, textvariable=v, values=choices_display, state="readonly", width=30
+        )
+        cb.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        full_key = f"D.{opt_name}"
+
+        def _on_dropdown_select(_e: tk.Event, s: str, k: str) -> None:
+            sel = v.get()
+            self._save_option(s, k, display_to_raw.get(sel, sel))
+
+        cb.bind(
+            "<<ComboboxSelected>>",
+            lambda e, s=section, k=full_key: _on_dropdown_select(e, s, k),
+        )
+        return row + 1
+
+    def _build_entry_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """E: free-text entry saved on focus out."""
+        self._add_option_label(parent, row, opt_name)
+        v = tk.StringVar(value=value)
+        self._widget_vars[f"{section}::{opt_name}"] = v
+        e = ttk.Entry(parent, textvariable=v, width=40)
+        e.grid(row=row, column=1, sticky="ew", padx=5, pady=2)
+        self._widget_meta[e] = (section, f"E.{opt_name}", v)
+        e.bind("<FocusOut>", self._on_focus_out)
+        return row + 1
+
+    def _build_number_widget(
+        self, parent: ttk.Frame | ttk.LabelFrame, row: int, opt_name: str, value: str, section: str
+    ) -> int:
+        """N: 0-999 spinbox saved on focus out."""
+        self._add_option_label(parent, row, opt_name)
+        try:
+            num_val = int(float(value))
+        except (ValueError, TypeError):
+            num_val = 0
+        v = tk.StringVar(value=str(num_val))
+        self._widget_vars[f"{section}::{opt_name}"] = v
+        sp = ttk.Spinbox(parent, from_=0, to=999, textvariable=v, width=10)
+        sp.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        self._widget_meta[sp] = (section, f"N.{opt_name}", v)
+        sp.bind("<FocusOut>", self._on_focus_out)
+        return row + 1
+
+    # Widget type letter -> builder(self, parent, row, opt_name, value, section)
+    _WIDGET_BUILDERS = {
+        "C": _build_comment_widget,
+        "L": _build_label_widget,
+        "T": _build_toggle_widget,
+        "D": _build_dropdown_widget,
+        "E": _build_entry_widget,
+        "N": _build_number_widget,
+    }
+
+    def _on_focus_out(self, event: tk.Event) -> None:
+        """Save the Entry/Spinbox option that lost focus."""
+        meta = self._widget_meta.get(event.widget)
+        if meta:
+            section, full_key, v = meta
+            self._save_option(section, full_key, v.get())
 
     def _save_option(self, section: str, full_key: str, value: str) -> None:
         """Save an option value back to the INI file."""
         self.config.set(section, full_key, value)
-        with open(self._ini_path, "w", encoding="utf-8") as f:
-            self.config.write(f)
+        self._index_section(section)
+        if full_key == "D.app_language" or full_key in _UPDATE_OPTION_KEYS:
+            # The translator and update timer read clock_app.ini themselves
+            self._write_ini()
+        elif self._flush_job is None:
+            self._flush_job = self.after(_INI_WRITE_DELAY_MS, self._write_ini)
         if full_key == "D.app_language":
             self._on_language_changed(value)
         elif full_key == "D.app_theme":
             parent = getattr(self, "parent", None)
             if parent and hasattr(parent, "apply_theme"):
                 parent.apply_theme(value)
+        elif full_key in _UPDATE_OPTION_KEYS:
+            parent = getattr(self, "parent", None)
+            if parent and hasattr(parent, "refresh_update_config"):
+                parent.refresh_update_config()
+
+    def _flush_ini(self) -> None:
+        """Write the INI file now if an edit is waiting on the delayed write."""
+        if self._flush_job is not None:
+            self._write_ini()
+
+    def _write_ini(self) -> None:
+        """Write the INI file, replacing any pending delayed write."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        with open(self._ini_path, "w", encoding="utf-8") as f:
+            self.config.write(f)
 
     def refresh_theme_colors(self) -> None:
         """Apply current app theme colors (bg/fg only)."""
@@ -350,15 +451,28 @@ class Options(ttk.Frame):
             return
 
         # Show loading screen first so user sees feedback immediately
-        self.grid_forget()
-        parent.loading.grid(row=0, column=0, sticky="nsew")
+        parent.switch_menu("loading")
         parent.loading.set_message(t("loading.translating", "Translating..."))
         parent.loading.set_progress(0)
         parent.update_idletasks()  # Force loading screen to render before thread starts
 
+        # Coalesce worker progress: at most one pending Tk callback, which shows the latest pct
+        progress_lock = threading.Lock()
+        progress_state: dict[str, Any] = {"pct": 0.0, "scheduled": False}
+
+        def _apply_progress() -> None:
+            with progress_lock:
+                pct = progress_state["pct"]
+                progress_state["scheduled"] = False
+            parent.loading.set_progress(pct)
+
         def _on_progress(done: int, total: int) -> None:
-            pct = 100.0 * done / total if total else 0
-            parent.after(0, lambda p=pct: parent.loading.set_progress(p))
+            with progress_lock:
+                progress_state["pct"] = 100.0 * done / total if total else 0
+                if progress_state["scheduled"]:
+                    return
+                progress_state["scheduled"] = True
+            parent.after(0, _apply_progress)
 
         def _worker() -> None:
             run(progress_callback=_on_progress)
@@ -373,6 +487,6 @@ class Options(ttk.Frame):
         set_language(lang_name)
         parent = getattr(self, "parent", None)
         if parent:
-            parent.loading.grid_forget()
             parent.refresh_translations()
             parent.switch_menu("options")
+            parent.loading.stop_animation()
@@ -7,21 +7,39 @@ Output format matches widget_var.option_name keys and [-C-]/[-S-] section header
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, Callable, Iterator
 
-from ..defaults.default_options import DefaultOptions
+from ..defaults.default_options import get_default_options
 
 _APP_ROOT = os.path.dirname(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__))))
 CLOCK_APP_INI_PATH: str = os.path.join(_APP_ROOT, "config", "clock_app.ini")
 
 
+def _join_items(value: Any) -> str:
+    """Join list/tuple items with ', '."""
+    return ", ".join(map(str, value))
+
+
+# Exact type -> converter; looked up by type() so bool never matches int
+_CONVERTERS: dict[type, Callable[[Any], str]] = {
+    str: str,
+    bool: str,  # "True" / "False"
+    int: str,
+    float: str,
+    list: _join_items,
+    tuple: _join_items,
+}
+
+
 def _value_to_ini(value: Any) -> str:
     """Convert an option value to a string for INI."""
-    if isinstance(value, list):
-        return ", ".join(str(item) for item in value)
-    if isinstance(value, bool):
-        return "True" if value else "False"
+    convert = _CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value)
+    # Subclasses (e.g. namedtuples) miss the exact-type table
+    if isinstance(value, (list, tuple)):
+        return _join_items(value)
     return str(value)
 
 
@@ -70,6 +88,26 @@ _INI_LAYOUT: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
 )
 
 
+# _INI_LAYOUT with the constant text pre-rendered: ("[section]\n" header, ((key, "wv.opt = "), ...));
+# every header after the first carries the blank separator line
+_PREFIX_TABLE: tuple[tuple[str, tuple[tuple[tuple[str, str], str], ...]], ...] = tuple(
+    (
+        ("\n" if i else "") + f"[{section_name}]\n",
+        tuple((key, f"{key[0]}.{key[1]} = ") for key in key_pairs),
+    )
+    for i, (section_name, key_pairs) in enumerate(_INI_LAYOUT)
+)
+
+
+def _ini_lines(options: dict[tuple[str, str], Any]) -> Iterator[str]:
+    """Yield clock_app.ini lines (newline-terminated), a blank line between sections."""
+    for header, rows in _PREFIX_TABLE:
+        yield header
+        for key, prefix in rows:
+            if key in options:
+                yield prefix + _value_to_ini(options[key]) + "\n"
+
+
 class CreateClockAppIni:
     """
     Creates clock_app.ini from default options when the file does not exist.
@@ -77,7 +115,7 @@ class CreateClockAppIni:
     """
 
     def __init__(self) -> None:
-        self.default_options = DefaultOptions()
+        self.default_options = get_default_options()
         self.create_clock_app_ini()
 
     def create_clock_app_ini(self) -> None:
@@ -88,20 +126,11 @@ class CreateClockAppIni:
         if os.path.exists(CLOCK_APP_INI_PATH):
             return
 
-        wvl = self.default_options.widget_variables_list
-        lines: list[str] = []
-
-        for i, (section_name, key_pairs) in enumerate(_INI_LAYOUT):
-            if i > 0:
-                lines.append("")
-            lines.append(f"[{section_name}]")
-            for wv, opt in key_pairs:
-                if opt in wvl.get(wv, {}):
-                    val = wvl[wv][opt]
-                    lines.append(f"{wv}.{opt} = {_value_to_ini(val)}")
-
-        content = "\n".join(lines)
-        if content and not content.endswith("\n"):
-            content += "\n"
-        with open(CLOCK_APP_INI_PATH, "w", encoding="utf-8") as f:
-            f.write(content)
+        os.makedirs(os.path.dirname(CLOCK_APP_INI_PATH), exist_ok=True)
+        # Write aside then swap in, so a crash never leaves a truncated ini behind
+        tmp_path = CLOCK_APP_INI_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", buffering=65536) as f:
+            f.writelines(_ini_lines(self.default_options.options))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CLOCK_APP_INI_PATH)
@@ -11,19 +11,50 @@ Run: python -m test.apps.clock_app.data.scripts.translate_ini_to_lang
 
 from __future__ import annotations
 
-import configparser
-from typing import Callable
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator
 import json
 import os
 import sys
+import threading
 import time
 
+from ... import fast_ini
+from ...imports import LANG_EN_PATH, LANG_PATHS
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: object, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (2-space indent if requested)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: object, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (2-space indent if requested)."""
+        return json.dumps(
+            obj, indent=2 if indent else None, ensure_ascii=False,
+            separators=None if indent else (",", ":"),
+        ).encode("utf-8")
+
 # Resolve paths relative to clock_app root
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _APP_ROOT = os.path.dirname(os.path.dirname(
     _SCRIPT_DIR))  # data/scripts -> clock_app
 _CONFIG_PATH = os.path.join(_APP_ROOT, "config", "clock_app.ini")
 _LANG_DIR = os.path.join(_APP_ROOT, "assets", "lib", "lang")
+# Previously translated strings, keyed "source|target|text", so reruns only translate new text
+_CACHE_PATH = os.path.join(_LANG_DIR, ".translate_cache.json")
+# Strings per worker task; progress is reported as each task finishes
+_CHUNK_MAX_ITEMS = 10
+# Parallel translate workers, and minimum spacing between any two translate requests
+# across all workers (0.2 s = at most 5 requests per second)
+_MAX_WORKERS = 4
+_REQUEST_INTERVAL_SEC = 0.2
 
 LANG_NAME_TO_CODE: dict[str, str] = {
     "English": "en",
@@ -43,13 +74,35 @@ def _get_target_language() -> str:
     if not os.path.exists(_CONFIG_PATH):
         print(f"Config not found: {_CONFIG_PATH}")
         sys.exit(1)
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(_CONFIG_PATH, encoding="utf-8")
-    for section in ["-S- General"]:
-        if cfg.has_section(section) and cfg.has_option(section, "D.app_language"):
-            return cfg.get(section, "D.app_language").strip()
-    return "English"
+    lang = fast_ini.load(_CONFIG_PATH).get("-S- General", {}).get("D.app_language")
+    return lang if lang is not None else "English"
+
+
+def _load_translate_cache() -> dict[str, str]:
+    """Load the translation cache; empty if missing or unreadable."""
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_translate_cache(cache: dict[str, str]) -> None:
+    """Save the translation cache (write aside, then swap in)."""
+    tmp_path = _CACHE_PATH + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(cache))
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError as e:
+        print(f"  Warning: could not save translation cache: {e}")
+
+
+def _chunks(texts: list[str]) -> Iterator[list[str]]:
+    """Split texts into worker tasks of at most _CHUNK_MAX_ITEMS strings."""
+    for i in range(0, len(texts), _CHUNK_MAX_ITEMS):
+        yield texts[i:i + _CHUNK_MAX_ITEMS]
 
 
 def _translate_batch(
@@ -65,28 +118,68 @@ def _translate_batch(
         print("Install deep-translator: pip install deep-translator")
         sys.exit(1)
 
-    translator = GoogleTranslator(source=source, target=target)
-    results: list[str] = []
+    cache = _load_translate_cache()
+    prefix = f"{source}|{target}|"
     total = len(texts)
-    done = 0
-    for i, text in enumerate(texts):
-        if not text or not text.strip():
-            results.append(text)
-            done += 1
-            continue
-        try:
-            translated = translator.translate(text)
-            results.append(translated if translated else text)
-        except Exception as e:
-            print(f"  Warning: could not translate {text[:50]!r}...: {e}")
-            results.append(text)
-        done = i + 1
-        if progress_callback:
-            progress_callback(done, total)
-        if (i + 1) % 20 == 0 or i == total - 1:
+    # Distinct non-blank texts without a cached translation, in first-seen order
+    pending = list(dict.fromkeys(
+        text for text in texts
+        if text and text.strip() and prefix + text not in cache
+    ))
+    pending_set = set(pending)
+    occurrences = Counter(text for text in texts if text in pending_set)
+    done = total - sum(occurrences.values())
+    if not pending and progress_callback:
+        progress_callback(done, total)
+
+    # GoogleTranslator keeps per-request state on the instance, so each worker gets its own
+    local = threading.local()
+    pace_lock = threading.Lock()
+    next_start = [time.monotonic()]
+
+    def _wait_turn() -> None:
+        """Block until this thread may send its next translate request (global rate limit)."""
+        with pace_lock:
+            now = time.monotonic()
+            start = max(now, next_start[0])
+            next_start[0] = start + _REQUEST_INTERVAL_SEC
+        if start > now:
+            time.sleep(start - now)
+
+    def _translate_chunk(chunk: list[str]) -> list[str | None]:
+        translator = getattr(local, "translator", None)
+        if translator is None:
+            translator = local.translator = GoogleTranslator(source=source, target=target)
+        # One request per string (translate_batch does the same internally), each one paced
+        out: list[str | None] = []
+        for text in chunk:
+            _wait_turn()
+            try:
+                out.append(translator.translate(text))
+            except Exception as e:
+                print(f"  Warning: could not translate {text[:50]!r}...: {e}")
+                out.append(None)
+        return out
+
+    # Results are merged and progress reported here, on the calling thread
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        futures = {pool.submit(_translate_chunk, chunk): chunk for chunk in _chunks(pending)}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            for text, result in zip(chunk, future.result()):
+                if result:
+                    cache[prefix + text] = result
+            done += sum(occurrences[text] for text in chunk)
+            if progress_callback:
+                progress_callback(done, total)
             print(f"  Progress: {done}/{total}")
-        time.sleep(0.15)  # Rate limit to avoid API throttling
-    return results
+
+    if pending:
+        _save_translate_cache(cache)
+    return [
+        cache.get(prefix + text, text) if text and text.strip() else text
+        for text in texts
+    ]
 
 
 def run(progress_callback: Callable[[int, int], None] | None = None) -> None:
@@ -100,15 +193,15 @@ def run(progress_callback: Callable[[int, int], None] | None = None) -> None:
         print("Target language is English; no translation needed.")
         return
 
-    en_path = os.path.join(_LANG_DIR, "en.json")
-    out_path = os.path.join(_LANG_DIR, f"{code}.json")
+    en_path = LANG_EN_PATH
+    out_path = LANG_PATHS.get(code) or os.path.join(_LANG_DIR, f"{code}.json")
 
     if not os.path.exists(en_path):
         print(f"Source not found: {en_path}")
         sys.exit(1)
 
-    with open(en_path, encoding="utf-8") as f:
-        source_data = json.load(f)
+    with open(en_path, "rb") as f:
+        source_data = _loads(f.read())
 
     # Filter to string values only
     items = [(k, v) for k, v in source_data.items() if isinstance(v, str)]
@@ -122,8 +215,8 @@ def run(progress_callback: Callable[[int, int], None] | None = None) -> None:
     translated = _translate_batch(values, "en", code, progress_callback=progress_callback)
 
     out_data = dict(zip(keys, translated))
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(out_data, f, indent=2, ensure_ascii=False)
+    with open(out_path, "wb") as f:
+        f.write(_dumps(out_data, indent=True))
 
     print(f"Saved to {out_path}")
 
@@ -6,17 +6,35 @@ Update checker for Clock App. Uses GitHub Releases API when source is GitHub.
 
 from __future__ import annotations
 
-import configparser
+import gzip
 import json
 import os
 import re
 import ssl
+import time
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from ..imports import CLOCK_APP_INI_PATH
+from .. import fast_ini
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+from ..imports import CLOCK_APP_INI_PATH, CONFIG_FOLDER
+
+# On-disk copy of GitHub API responses: {url: {"etag": str, "data": parsed JSON, "fetched_at": float}}
+_UPDATE_CACHE_PATH: str = os.path.join(CONFIG_FOLDER, ".update_cache.json")
+
+# D.app_update_check_frequency -> seconds a cached response is reused without any request.
+# One hour short of the auto-update interval so each scheduled check still reaches GitHub.
+_CACHE_FRESH_SEC: dict[str, int] = {
+    "Daily": 86400 - 3600, "Weekly": 604_800 - 3600, "Monthly": 2_592_000 - 3600,
+}
 
 
 @dataclass
@@ -31,11 +49,15 @@ class UpdateResult:
     error: str | None = None
 
 
+# Start of a version suffix such as -dev, _beta or rc1
+_VERSION_SUFFIX_RE = re.compile(r"[-_a-z]")
+
+
 def _parse_version(version_str: str) -> list[int]:
     """Parse version string like '0.0.01' or 'v0.0.02-dev' into comparable parts."""
     # Strip leading 'v' and any suffix (-dev, -beta, etc.)
-    cleaned = re.sub(r"^v", "", str(version_str).strip().lower())
-    cleaned = re.split(r"[-_a-z]", cleaned, maxsplit=1)[0]
+    cleaned = str(version_str).strip().lower().removeprefix("v")
+    cleaned = _VERSION_SUFFIX_RE.split(cleaned, maxsplit=1)[0]
     parts: list[int] = []
     for p in cleaned.split("."):
         try:
@@ -45,45 +67,39 @@ def _parse_version(version_str: str) -> list[int]:
     return parts if parts else [0]
 
 
+@lru_cache(maxsize=256)
+def _version_key(version_str: str) -> tuple[int, ...]:
+    """Comparable form of a version: parsed parts without trailing zeros (1.0 == 1.0.0)."""
+    parts = _parse_version(version_str)
+    end = len(parts)
+    while end and parts[end - 1] == 0:
+        end -= 1
+    return tuple(parts[:end])
+
+
 def _version_less_than(current: str, latest: str) -> bool:
     """Return True if current < latest."""
-    cur_parts = _parse_version(current)
-    lat_parts = _parse_version(latest)
-    max_len = max(len(cur_parts), len(lat_parts))
-    for i in range(max_len):
-        c = cur_parts[i] if i < len(cur_parts) else 0
-        l_ = lat_parts[i] if i < len(lat_parts) else 0
-        if c < l_:
-            return True
-        if c > l_:
-            return False
-    return False
+    return _version_key(current) < _version_key(latest)
 
 
+# owner/repo at the end of a GitHub URL, ignoring a .git suffix, trailing slashes and whitespace
+_REPO_RE = re.compile(r"github\.com/([^/\s]+/[^/\s]+?)(?:\.git)?/*\s*$")
+
+
+@lru_cache(maxsize=8)
 def _extract_repo_from_github_url(url: str) -> str | None:
     """Extract 'owner/repo' from https://github.com/owner/repo or similar."""
     if not url or "github.com" not in url:
         return None
-    url = url.strip().rstrip("/")
-    # Handle optional .git suffix
-    if url.endswith(".git"):
-        url = url[:-4]
-    parts = url.split("github.com/")
-    if len(parts) < 2:
-        return None
-    repo_path = parts[-1].strip().rstrip("/")
-    if "/" in repo_path and not repo_path.startswith("/"):
-        return repo_path
-    return None
+    m = _REPO_RE.search(url)
+    return m.group(1) if m else None
 
 
-def _release_matches_channel(release: dict[str, Any], channel: str) -> bool:
-    """Return True if release matches the update channel (Stable, Beta, Dev)."""
+@lru_cache(maxsize=128)
+def _release_matches_channel(prerelease: bool, tag: str, name: str, channel: str) -> bool:
+    """Return True if a release (prerelease flag, tag_name, name) matches the update channel (Stable, Beta, Dev)."""
     channel = (channel or "Stable").strip().lower()
-    prerelease = release.get("prerelease", False)
-    tag = (release.get("tag_name") or "").lower()
-    name = (release.get("name") or "").lower()
-    combined = f"{tag} {name}"
+    combined = f"{tag} {name}".lower()
 
     if channel == "stable":
         return not prerelease
@@ -94,7 +110,104 @@ def _release_matches_channel(release: dict[str, Any], channel: str) -> bool:
     return not prerelease
 
 
+def _read_update_cache() -> dict[str, Any]:
+    """Load the response cache; empty dict if missing or unreadable."""
+    try:
+        with open(_UPDATE_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_update_cache(cache: dict[str, Any]) -> None:
+    """Save the response cache; failures only cost a full download next time."""
+    tmp_path = _UPDATE_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, _UPDATE_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _cached_github_get(url: str, max_age: float | None = None) -> Any:
+    """
+    GET url from the GitHub API and return the parsed JSON. A cached response younger
+    than max_age seconds is returned without a request; otherwise the cached ETag is
+    sent as If-None-Match so an unchanged resource comes back as a bodiless 304.
+    Raises on network errors and ValueError on an undecodable body.
+    """
+    cache = _read_update_cache()
+    entry = cache.get(url)
+    if not (isinstance(entry, dict) and "data" in entry):
+        entry = None
+    now = time.time()
+    if entry and max_age is not None and now - float(entry.get("fetched_at") or 0) < max_age:
+        return entry["data"]
+
+    headers = {"Accept": "application/vnd.github.v3+json",
+               "Accept-Encoding": "gzip",
+               "User-Agent": "Clock-App"}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    ctx = ssl.create_default_context()
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
+            raw = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            etag = resp.headers.get("ETag")
+        # Both decoders take the UTF-8 bytes directly; no intermediate str
+        data = _loads(raw)
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or entry is None:
+            raise
+        data, etag = entry["data"], entry.get("etag")
+    cache[url] = {"etag": etag, "data": data, "fetched_at": now}
+    _write_update_cache(cache)
+    return data
+
+
+# Releases requested per check on the Beta/Dev channels (newest first)
+_RELEASES_PER_PAGE: int = 10
+
+# D.app_update_option values (lowercase) under which only a user-requested check runs
+_UPDATE_OPTIONS_OFF: frozenset[str] = frozenset({"manual", "disabled", "off", "never"})
+
+# Sections holding update settings, and option name (after "X.") -> _load_update_config key
+_UPDATE_SECTIONS: tuple[str, ...] = ("-C- App Info", "-S- Updates")
+_UPDATE_CONFIG_KEYS: dict[str, str] = {
+    "app_github_url": "github_url",
+    "app_version": "current_version",
+    "app_update_option": "update_option",
+    "app_update_channel": "channel",
+    "app_update_check_frequency": "frequency",
+    "app_update_check_time": "check_time",
+    "app_update_source": "source",
+}
+
+
+# clock_app.ini path -> (st_mtime_ns, update config); reparsed only when the file changes
+_UPDATE_CONFIG_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+
+
 def _load_update_config() -> dict[str, Any]:
+    """Return update-related config from clock_app.ini (shared; treat as read-only)."""
+    try:
+        mtime = os.stat(CLOCK_APP_INI_PATH).st_mtime_ns
+    except OSError:
+        mtime = -1
+    cached = _UPDATE_CONFIG_CACHE.get(CLOCK_APP_INI_PATH)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    out = _parse_update_config()
+    _UPDATE_CONFIG_CACHE[CLOCK_APP_INI_PATH] = (mtime, out)
+    return out
+
+
+def _parse_update_config() -> dict[str, Any]:
     """Load update-related config from clock_app.ini."""
     out: dict[str, Any] = {
         "update_option": "Automatic",
@@ -105,46 +218,29 @@ def _load_update_config() -> dict[str, Any]:
         "github_url": "",
         "current_version": "0.0.01",
     }
-    if not os.path.exists(CLOCK_APP_INI_PATH):
-        return out
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(CLOCK_APP_INI_PATH, encoding="utf-8")
-
-    for sect in ["-C- App Info", "-S- Updates"]:
-        if not cfg.has_section(sect):
-            continue
-        for key in cfg.options(sect):
-            name = key.split(".", 1)[-1] if "." in key else key
-            val = cfg.get(sect, key).strip()
-            if name == "app_github_url":
-                out["github_url"] = val
-            elif name == "app_version":
-                out["current_version"] = val
-            elif name == "app_update_option":
-                out["update_option"] = val
-            elif name == "app_update_channel":
-                out["channel"] = val
-            elif name == "app_update_check_frequency":
-                out["frequency"] = val
-            elif name == "app_update_check_time":
-                out["check_time"] = val
-            elif name == "app_update_source":
-                out["source"] = val
+    ini = fast_ini.load(CLOCK_APP_INI_PATH)
+    for sect in _UPDATE_SECTIONS:
+        for key, val in ini.get(sect, {}).items():
+            out_key = _UPDATE_CONFIG_KEYS.get(key.split(".", 1)[-1])
+            if out_key is not None:
+                out[out_key] = val
     return out
 
 
-def check_for_updates() -> UpdateResult:
+def check_for_updates(force: bool = False) -> UpdateResult:
     """
     Check for updates using the configured source (GitHub only for now).
     Returns UpdateResult with has_update, latest_version, release_url, etc.
+    Unless force is set, nothing is fetched when automatic updates are off, and a
+    release list fetched within the check frequency is reused.
     """
     config = _load_update_config()
     current = config.get("current_version", "0.0.01")
     source = (config.get("source") or "GitHub").strip()
     channel = config.get("channel", "Stable")
+    updates_off = (config.get("update_option") or "Automatic").strip().lower() in _UPDATE_OPTIONS_OFF
 
-    if source.lower() != "github":
+    if source.lower() != "github" or (updates_off and not force):
         return UpdateResult(
             has_update=False,
             current_version=current,
@@ -165,29 +261,28 @@ def check_for_updates() -> UpdateResult:
             error="Invalid GitHub URL in config",
         )
 
+    # Stable only needs GitHub's newest non-prerelease; other channels scan the first page
+    stable = (channel or "Stable").strip().lower() == "stable"
     api_url = f"https://api.github.com/repos/{repo}/releases"
+    api_url += "/latest" if stable else f"?per_page={_RELEASES_PER_PAGE}"
+    max_age = None if force else _CACHE_FRESH_SEC.get(
+        config.get("frequency") or "Daily", _CACHE_FRESH_SEC["Daily"])
     try:
-        ctx = ssl.create_default_context()
-        req = urllib.request.Request(
-            api_url,
-            headers={"Accept": "application/vnd.github.v3+json",
-                     "User-Agent": "Clock-App"},
-        )
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
-            data = resp.read().decode("utf-8")
-    except Exception as e:
-        return UpdateResult(
-            has_update=False,
-            current_version=current,
-            latest_version=current,
-            release_url="",
-            release_notes="",
-            error=str(e),
-        )
-
-    try:
-        releases = json.loads(data)
-    except json.JSONDecodeError as e:
+        releases = _cached_github_get(api_url, max_age)
+        if stable and isinstance(releases, dict):
+            releases = [releases]
+    except urllib.error.HTTPError as e:
+        if not (stable and e.code == 404):
+            return UpdateResult(
+                has_update=False,
+                current_version=current,
+                latest_version=current,
+                release_url="",
+                release_notes="",
+                error=str(e),
+            )
+        releases = []  # /latest is 404 until the repo has a stable release
+    except Exception as e:  # network errors, and ValueError from an undecodable body
         return UpdateResult(
             has_update=False,
             current_version=current,
@@ -208,10 +303,11 @@ def check_for_updates() -> UpdateResult:
         )
 
     for rel in releases:
-        if not _release_matches_channel(rel, channel):
-            continue
         tag = rel.get("tag_name") or ""
-        tag_clean = re.sub(r"^v", "", tag)
+        if not _release_matches_channel(
+                bool(rel.get("prerelease", False)), tag, rel.get("name") or "", channel):
+            continue
+        tag_clean = tag.removeprefix("v")
         if _version_less_than(current, tag_clean):
             return UpdateResult(
                 has_update=True,
@@ -0,0 +1,42 @@
+"""
+Lightweight INI reader for Clock App.
+Reads the plain `key = value` sections of clock_app.ini without configparser
+(no interpolation, continuation lines, or option-name folding).
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+
+_SECTION = re.compile(r"^\s*\[(.+?)\]\s*$")
+_KV = re.compile(r"^\s*([^=;#]+?)\s*=\s*(.*?)\s*$")
+
+
+def parse(text: str) -> dict[str, dict[str, str]]:
+    """
+    Parse INI text into {section: {key: value}}. Keys keep their case and are
+    interned so later lookups against option-name literals compare by identity.
+    """
+    data: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    for line in text.splitlines():
+        m = _SECTION.match(line)
+        if m:
+            current = data.setdefault(sys.intern(m.group(1)), {})
+            continue
+        if current is None:
+            continue
+        m = _KV.match(line)
+        if m:
+            current[sys.intern(m.group(1))] = m.group(2)
+    return data
+
+
+def load(path: str) -> dict[str, dict[str, str]]:
+    """Read and parse the INI file at path. Returns empty dict if it cannot be read."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return parse(f.read())
+    except OSError:
+        return {}
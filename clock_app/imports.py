@@ -4,9 +4,12 @@ This is the imports module for the clock app.
 It will contain the imports for the clock app.
 """
 
+from __future__ import annotations
+
 import os
 from importlib import import_module
-from types import ModuleType
+
+from .assets.lib.lang.translator import LANG_NAME_TO_CODE
 
 # Use __file__ to avoid circular import during package load
 _IMPORTS_DIR: str = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +24,11 @@ ASSETS_FOLDER: str = os.path.join(APP_ROOT, "assets")
 IMAGES_FOLDER: str = os.path.join(ASSETS_FOLDER, "images")
 # The lang folder for translation JSON files
 LANG_FOLDER: str = os.path.join(ASSETS_FOLDER, "lib", "lang")
+# Language files, joined once here instead of at every load
+LANG_EN_PATH: str = os.path.join(LANG_FOLDER, "en.json")
+LANG_PATHS: dict[str, str] = {
+    code: os.path.join(LANG_FOLDER, f"{code}.json") for code in LANG_NAME_TO_CODE.values()
+}
 # The data folder is the folder called data in the clock app folder
 DATA_FOLDER: str = os.path.join(APP_ROOT, "data")
 # The scripts folder is the folder called scripts in the data folder
@@ -28,29 +36,26 @@ SCRIPTS_FOLDER: str = os.path.join(DATA_FOLDER, "scripts")
 # The menus folder is the folder called menus in the data folder
 MENUS_FOLDER: str = os.path.join(DATA_FOLDER, "menus")
 DEFAULT_FOLDER: str = os.path.join(DATA_FOLDER, "defaults")
-# Load modules in dependency order to avoid circular imports
 _CLOCK_APP_PKG: str = "clock_app"
-DEFAULT_OPTIONS_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.defaults.default_options")
-default_options = DEFAULT_OPTIONS_MODULE.DefaultOptions
-CREATE_CLOCK_APP_INI_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.scripts.create_clock_app_ini")
-create_clock_app_ini = CREATE_CLOCK_APP_INI_MODULE.CreateClockAppIni
-OPTIONS_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.menus.options")
-Options = OPTIONS_MODULE.Options
-LOADING_FILE_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.menus.loading")
-Loading = LOADING_FILE_MODULE.Loading
-CONSOLE_FILE_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.menus.console")
-Console = CONSOLE_FILE_MODULE.Console
-MAIN_MENU_FILE_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.menus.main")
-MainMenu = MAIN_MENU_FILE_MODULE.MainMenu
-CLOCK_FILE_MODULE: ModuleType = import_module(
-    f"{_CLOCK_APP_PKG}.data.menus.clock")
-Clock = CLOCK_FILE_MODULE.Clock
+# Public name -> (module, attribute or None for the module itself); imported on first access
+# so path-only users (update checker, scripts) do not pull in the Tk menus
+_LAZY_ATTRS: dict[str, tuple[str, str | None]] = {
+    "DEFAULT_OPTIONS_MODULE": ("data.defaults.default_options", None),
+    "default_options": ("data.defaults.default_options", "DefaultOptions"),
+    "CREATE_CLOCK_APP_INI_MODULE": ("data.scripts.create_clock_app_ini", None),
+    "create_clock_app_ini": ("data.scripts.create_clock_app_ini", "CreateClockAppIni"),
+    "OPTIONS_MODULE": ("data.menus.options", None),
+    "Options": ("data.menus.options", "Options"),
+    "LOADING_FILE_MODULE": ("data.menus.loading", None),
+    "Loading": ("data.menus.loading", "Loading"),
+    "CONSOLE_FILE_MODULE": ("data.menus.console", None),
+    "Console": ("data.menus.console", "Console"),
+    "MAIN_MENU_FILE_MODULE": ("data.menus.main", None),
+    "MainMenu": ("data.menus.main", "MainMenu"),
+    "CLOCK_FILE_MODULE": ("data.menus.clock", None),
+    "Clock": ("data.menus.clock", "Clock"),
+    "ClockApp": ("app", "ClockApp"),
+}
 ANALOG_CLOCK_IMAGE: str = os.path.join(IMAGES_FOLDER, "analog_clock.png")
 analog_clock_image = ANALOG_CLOCK_IMAGE
 HOUR_HAND_IMAGE: str = os.path.join(
@@ -65,8 +70,12 @@ second_hand_image = SECOND_HAND_IMAGE
 
 
 def __getattr__(name: str):
-    """Lazy-load ClockApp to avoid circular import with app.py."""
-    if name == "ClockApp":
-        from clock_app.app import ClockApp
-        return ClockApp
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    """Import the module behind name on first access (PEP 562); ClockApp avoids a cycle with app.py."""
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    module = import_module(f"{_CLOCK_APP_PKG}.{module_name}")
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value